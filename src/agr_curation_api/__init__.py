@@ -8,7 +8,9 @@ This client supports multiple data access methods:
 - Database: Direct SQL queries for high-performance bulk access
 """
 
-from .client import AGRCurationAPIClient, DataSource
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     AGRAPIError,
     AGRAuthenticationError,
@@ -27,6 +29,7 @@ from .models import (
     APIResponse,
     CrossReference,
     DataProvider,
+    Reference,
     SlotAnnotation,
     AffectedGenomicModel,
     DiseaseAnnotation,
@@ -38,7 +41,18 @@ from .graphql_queries import (
 )
 from .api_methods import APIMethods
 from .graphql_methods import GraphQLMethods
-from .db_methods import DatabaseMethods, DatabaseConfig
+
+if TYPE_CHECKING:
+    from .client import AGRCurationAPIClient, DataSource
+    from .db_methods import DatabaseMethods, DatabaseConfig
+
+# Names whose modules pull in authentication or SQLAlchemy setup; imported on first access
+_LAZY_EXPORTS = {
+    "AGRCurationAPIClient": ".client",
+    "DataSource": ".client",
+    "DatabaseMethods": ".db_methods",
+    "DatabaseConfig": ".db_methods",
+}
 
 __version__ = "0.13.0"
 __all__ = [
@@ -59,6 +73,7 @@ __all__ = [
     "APIResponse",
     "CrossReference",
     "DataProvider",
+    "Reference",
     "SlotAnnotation",
     "AffectedGenomicModel",
     "DiseaseAnnotation",
@@ -70,3 +85,17 @@ __all__ = [
     "DatabaseMethods",
     "DatabaseConfig",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the client and database exports on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
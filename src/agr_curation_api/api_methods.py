@@ -31,12 +31,13 @@ class APIMethods:
     the actual HTTP communication.
     """
 
-    def __init__(self, make_request_func: Callable[..., Dict[str, Any]]) -> None:
+    def __init__(self, make_request_func: Callable[..., Any]) -> None:
         """Initialize API methods.
 
         Args:
             make_request_func: Function to make HTTP requests
-                Should have signature: func(method: str, endpoint: str, data: Optional[Dict]) -> Dict
+                Should have signature: func(method: str, endpoint: str, data: Optional[Dict], raw: bool = False)
+                and return the decoded JSON dict, or the raw response bytes when raw is True
         """
         self._make_request = make_request_func
 
@@ -592,9 +593,9 @@ class APIMethods:
             _apply_date_sorting(req_data, updated_after)
 
         url = f"{entity_type}/search?limit={limit}&page={page}"
-        response_data = self._make_request("POST", url, req_data)
+        response_body = self._make_request("POST", url, req_data, raw=True)
 
         try:
-            return APIResponse(**response_data)
+            return APIResponse.parse_response(response_body)
         except ValidationError as e:
             raise AGRValidationError(f"Invalid API response: {str(e)}")
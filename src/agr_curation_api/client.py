@@ -311,8 +311,13 @@ class AGRCurationAPIClient:
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        """Make a request to the A-Team API."""
+        raw: bool = False,
+    ) -> Any:
+        """Make a request to the A-Team API.
+
+        Returns the decoded JSON object, or the undecoded response body when
+        ``raw`` is set so callers can hand it straight to ``model_validate_json``.
+        """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         headers = self._get_headers()
 
@@ -326,8 +331,10 @@ class AGRCurationAPIClient:
             with urllib.request.urlopen(request) as response:
                 if response.getcode() == 200:
                     logger.debug("Request successful")
-                    res = response.read().decode("utf-8")
-                    return dict(json.loads(res))
+                    body = response.read()
+                    if raw:
+                        return body
+                    return dict(json.loads(body.decode("utf-8")))
                 else:
                     raise AGRAPIError(f"Request failed with status: {response.getcode()}")
 
@@ -8,8 +8,11 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+import weakref
+from functools import lru_cache
 from os import environ
-from typing import List, Optional, Dict, Any, Set
+from typing import Callable, List, Optional, Dict, Any, Set, Tuple
 from sqlalchemy.engine import Engine
 
 from sqlalchemy import create_engine, text, bindparam
@@ -33,6 +36,49 @@ _LITERATURE_XREF_PREFIXES = {
 }
 _AGRKB_CURIE_RE = re.compile(r"^AGR(?:KB)?:", re.IGNORECASE)
 
+# The ontology search tiers only ever build a handful of distinct SQL strings (per
+# synonym/exclusion variant). text() scans each string for bind parameters, so reuse
+# one TextClause per distinct statement instead of rebuilding it on every search.
+_cached_text = lru_cache(maxsize=64)(text)
+
+
+def _lru_cache_method(method: Callable[..., Any], maxsize: int) -> Callable[..., Any]:
+    """Wrap a bound method in an lru_cache that only holds a weak reference to its instance.
+
+    Caching the bound method directly would make the instance reference itself
+    through its own cache, so it could only be freed by the cycle collector.
+    """
+    method_ref = weakref.WeakMethod(method)
+
+    @lru_cache(maxsize=maxsize)
+    def cached(*args: Any) -> Any:
+        bound = method_ref()
+        if bound is None:
+            raise ReferenceError("the instance owning this cache no longer exists")
+        return bound(*args)
+
+    return cached
+
+
+def _ontology_result_from_row(row: Any, match_type: str) -> OntologyTermResult:
+    """Build an OntologyTermResult from a (curie, name, namespace, definition, type, synonyms) row.
+
+    Database columns already have the model's types, so rows carrying every
+    required value skip pydantic validation; anything else is validated as usual.
+    """
+    fields = {
+        "curie": row[0],
+        "name": row[1],
+        "namespace": row[2] or "",
+        "definition": row[3],
+        "ontology_type": row[4],
+        "synonyms": tuple(row[5] or ()),
+        "match_type": match_type,
+    }
+    if row[0] is None or row[1] is None or row[4] is None:
+        return OntologyTermResult(**fields)
+    return OntologyTermResult.model_construct(**fields)
+
 
 class DatabaseConfig:
     """Configuration for database connection."""
@@ -78,6 +124,7 @@ class DatabaseMethods:
         self,
         config: Optional[DatabaseConfig] = None,
         literature_es_config: Optional[LiteratureESConfig] = None,
+        ontology_search_cache_size: int = 0,
     ) -> None:
         """Initialize database methods.
 
@@ -86,12 +133,29 @@ class DatabaseMethods:
             literature_es_config: Literature Elasticsearch configuration used by
                 the literature reference search helpers (defaults to environment
                 variables).
+            ontology_search_cache_size: Number of distinct search_ontology_terms()
+                queries to memoize on this instance. Defaults to 0 (no caching);
+                cached results are kept until clear_ontology_search_cache() is
+                called, so only enable it when the ontology data will not change
+                underneath this instance.
         """
         self.config = config or DatabaseConfig()
         self.literature_es_config = literature_es_config or LiteratureESConfig()
         self._engine: Optional[Engine] = None
         self._session_factory: Optional[sessionmaker[Session]] = None
+        # Guards lazy engine/session factory creation when one instance is shared across threads
+        self._engine_lock = threading.Lock()
         self._literature_es_client: Optional[Any] = None
+        # Per-instance LRU cache over (term, ontology_type, exact_match, include_synonyms, limit)
+        self._search_ontology_terms_cached: Callable[..., Tuple[OntologyTermResult, ...]] = _lru_cache_method(
+            self._search_ontology_terms_uncached, ontology_search_cache_size
+        )
+        # Session lent to cache misses by search_ontology_terms_batch(), per calling thread
+        self._batch_session = threading.local()
+
+    def clear_ontology_search_cache(self) -> None:
+        """Drop memoized search_ontology_terms() results, e.g. after ontology data is reloaded."""
+        self._search_ontology_terms_cached.cache_clear()  # type: ignore[attr-defined]
 
     def _get_engine(self) -> Engine:
         """Get or create database engine.
@@ -100,17 +164,21 @@ class DatabaseMethods:
         which is important for long-running test suites over SSM tunnels.
         """
         if self._engine is None:
-            self._engine = create_engine(
-                self.config.connection_string,
-                pool_pre_ping=True,  # Verify connection is alive before each use
-            )
+            with self._engine_lock:
+                if self._engine is None:
+                    self._engine = create_engine(
+                        self.config.connection_string,
+                        pool_pre_ping=True,  # Verify connection is alive before each use
+                    )
         return self._engine
 
     def _get_session_factory(self) -> sessionmaker[Session]:
         """Get or create session factory."""
         if self._session_factory is None:
             engine = self._get_engine()
-            self._session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+            with self._engine_lock:
+                if self._session_factory is None:
+                    self._session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
         return self._session_factory
 
     def _create_session(self) -> Session:
@@ -2090,7 +2158,7 @@ class DatabaseMethods:
                 namespace=row[2] or "",
                 definition=row[3],
                 ontology_type=row[4],
-                synonyms=row[5] or [],
+                synonyms=row[5] or (),
             )
 
         except Exception as e:
@@ -2156,7 +2224,7 @@ class DatabaseMethods:
                     namespace=row[2] or "",
                     definition=row[3],
                     ontology_type=row[4],
-                    synonyms=row[5] or [],
+                    synonyms=row[5] or (),
                 )
 
             return results
@@ -2195,7 +2263,7 @@ class DatabaseMethods:
             - Performance: Uses tiered search strategy (exact → prefix → contains → trigram)
                 - Tier 1 (Exact): UPPER(name) = 'PATTERN' (uses B-tree index, 5-20ms)
                 - Tier 2 (Prefix): UPPER(name) LIKE 'PATTERN%' (uses B-tree index, 5-20ms)
-                - Tier 3 (Contains): UPPER(name) LIKE '%PATTERN%' (sequential scan, ~990ms)
+                - Tier 3 (Contains): UPPER(name) LIKE '%PATTERN%' (pg_trgm GIN indexes)
                 - Tier 4 (Trigram): pg_trgm word-similarity OPERATOR (%>), GIN-index-accelerated
             - Most queries hit Tier 1 or 2 (5-10x faster on average)
             - Tiers 3-4 only run when earlier tiers under-fill the result limit
@@ -2208,69 +2276,157 @@ class DatabaseMethods:
               actually used; the cutoff is set transaction-locally via the
               pg_trgm.word_similarity_threshold GUC. Requires the pg_trgm extension
               (CREATE EXTENSION pg_trgm) and those GIN indexes on the target database.
+            - When ontology_search_cache_size is set, results are memoized per instance, so
+              repeated identical searches (ignoring the case of term) skip the database. Each call returns a new
+              list, but the OntologyTermResult objects in it are shared between calls.
+              Use clear_ontology_search_cache() to force fresh queries.
         """
 
         if not term:
             return []
 
-        session = self._create_session()
+        # Every tier compares upper-cased text, so the upper-cased term is the cache key:
+        # 'brain' and 'Brain' share one entry
+        return list(
+            self._search_ontology_terms_cached(term.upper(), ontology_type, exact_match, include_synonyms, limit)
+        )
+
+    def _search_ontology_terms_uncached(
+        self, search_upper: str, ontology_type: str, exact_match: bool, include_synonyms: bool, limit: int
+    ) -> Tuple["OntologyTermResult", ...]:
+        """Run the tiered ontology search for an upper-cased term (backs the search cache).
+
+        Inside search_ontology_terms_batch() the batch's session is used; otherwise
+        the search opens and closes its own.
+        """
+        shared_session: Optional[Session] = getattr(self._batch_session, "session", None)
+        session = shared_session if shared_session is not None else self._create_session()
         try:
-            search_upper = term.upper()
-            results = []
+            return tuple(
+                self._search_ontology_tiers(session, search_upper, ontology_type, exact_match, include_synonyms, limit)
+            )
 
-            # If exact_match is True, only do Tier 1
-            if exact_match:
-                exact_results = self._search_ontology_exact(session, search_upper, ontology_type, include_synonyms)
-                results.extend(exact_results)
-            else:
-                # Tier 1: Try exact match first (fast - uses B-tree index)
-                exact_results = self._search_ontology_exact(session, search_upper, ontology_type, include_synonyms)
-                results.extend(exact_results)
-
-                # If we have enough results, return early
-                if len(results) >= limit:
-                    return results[:limit]
-
-                # Tier 2: Try prefix match (fast - uses B-tree index)
-                exclude_curies = {r.curie for r in results}
-                remaining_limit = limit - len(results)
-                prefix_results = self._search_ontology_prefix(
-                    session, search_upper, ontology_type, include_synonyms, exclude_curies, remaining_limit
-                )
-                results.extend(prefix_results)
+        except Exception as e:
+            if shared_session is not None:
+                # Leave the batch's session usable for its remaining terms
+                shared_session.rollback()
+            raise AGRAPIError(f"Database query failed: {str(e)}")
+        finally:
+            if shared_session is None:
+                session.close()
 
-                # If we have enough results, return early
-                if len(results) >= limit:
-                    return results[:limit]
+    def search_ontology_terms_batch(
+        self,
+        terms: List[str],
+        ontology_type: str,
+        exact_match: bool = False,
+        include_synonyms: bool = True,
+        limit: int = 20,
+    ) -> Dict[str, List["OntologyTermResult"]]:
+        """Search several terms within one ontology using a single database session.
 
-                # Tier 3: Fall back to contains match (slow - sequential scan)
-                exclude_curies = {r.curie for r in results}
-                remaining_limit = limit - len(results)
-                contains_results = self._search_ontology_contains(
-                    session, search_upper, ontology_type, include_synonyms, exclude_curies, remaining_limit
-                )
-                results.extend(contains_results)
-
-                # If we have enough results, return early
-                if len(results) >= limit:
-                    return results[:limit]
-
-                # Tier 4: Trigram fuzzy match (pg_trgm) for approximate matches that
-                # substring matching cannot reach (typos, word order, partial phrases).
-                exclude_curies = {r.curie for r in results}
-                remaining_limit = limit - len(results)
-                trigram_results = self._search_ontology_trigram(
-                    session, search_upper, ontology_type, include_synonyms, exclude_curies, remaining_limit
-                )
-                results.extend(trigram_results)
+        Each term gets the same tiered search as search_ontology_terms() and goes
+        through the same search cache: cached terms skip the database, and the
+        remaining searches share one session and connection instead of checking one
+        out per term.
 
-            return results[:limit]
+        Args:
+            terms: Search terms (e.g., ['cell', 'tissue', 'liver'])
+            ontology_type: Ontology term type (e.g., 'BTOTerm', 'GOTerm')
+            exact_match: If True, only return exact matches (default: False)
+            include_synonyms: Include synonym fields in search (default: True)
+            limit: Maximum number of results per term (default: 20)
 
-        except Exception as e:
-            raise AGRAPIError(f"Database query failed: {str(e)}")
+        Returns:
+            Dictionary mapping each search term to its list of OntologyTermResult
+            objects, in input order. A term repeated in ``terms`` appears once.
+
+        Example:
+            hits = db.search_ontology_terms_batch(['cell', 'tissue', 'liver'], 'BTOTerm', limit=50)
+            cell_terms = hits['cell']
+        """
+        results: Dict[str, List["OntologyTermResult"]] = {}
+        session = self._create_session()
+        self._batch_session.session = session
+        try:
+            for term in terms:
+                if term not in results:
+                    results[term] = self.search_ontology_terms(
+                        term=term,
+                        ontology_type=ontology_type,
+                        exact_match=exact_match,
+                        include_synonyms=include_synonyms,
+                        limit=limit,
+                    )
+            return results
         finally:
+            self._batch_session.session = None
             session.close()
 
+    def _search_ontology_tiers(
+        self,
+        session: Session,
+        search_upper: str,
+        ontology_type: str,
+        exact_match: bool,
+        include_synonyms: bool,
+        limit: int,
+    ) -> List["OntologyTermResult"]:
+        """Run the exact → prefix → contains → trigram search tiers for one term.
+
+        Later tiers only run while the result limit is unfilled, and each excludes
+        CURIEs already found by earlier tiers.
+        """
+        results: List["OntologyTermResult"] = []
+
+        # If exact_match is True, only do Tier 1
+        if exact_match:
+            exact_results = self._search_ontology_exact(session, search_upper, ontology_type, include_synonyms)
+            results.extend(exact_results)
+        else:
+            # Tier 1: Try exact match first (fast - uses B-tree index)
+            exact_results = self._search_ontology_exact(session, search_upper, ontology_type, include_synonyms)
+            results.extend(exact_results)
+
+            # If we have enough results, return early
+            if len(results) >= limit:
+                return results[:limit]
+
+            # Tier 2: Try prefix match (fast - uses B-tree index)
+            exclude_curies = {r.curie for r in results}
+            remaining_limit = limit - len(results)
+            prefix_results = self._search_ontology_prefix(
+                session, search_upper, ontology_type, include_synonyms, exclude_curies, remaining_limit
+            )
+            results.extend(prefix_results)
+
+            # If we have enough results, return early
+            if len(results) >= limit:
+                return results[:limit]
+
+            # Tier 3: Fall back to contains match (uses pg_trgm GIN indexes)
+            exclude_curies = {r.curie for r in results}
+            remaining_limit = limit - len(results)
+            contains_results = self._search_ontology_contains(
+                session, search_upper, ontology_type, include_synonyms, exclude_curies, remaining_limit
+            )
+            results.extend(contains_results)
+
+            # If we have enough results, return early
+            if len(results) >= limit:
+                return results[:limit]
+
+            # Tier 4: Trigram fuzzy match (pg_trgm) for approximate matches that
+            # substring matching cannot reach (typos, word order, partial phrases).
+            exclude_curies = {r.curie for r in results}
+            remaining_limit = limit - len(results)
+            trigram_results = self._search_ontology_trigram(
+                session, search_upper, ontology_type, include_synonyms, exclude_curies, remaining_limit
+            )
+            results.extend(trigram_results)
+
+        return results[:limit]
+
     def _search_ontology_exact(
         self, session: Session, search_upper: str, ontology_type: str, include_synonyms: bool
     ) -> List["OntologyTermResult"]:
@@ -2290,7 +2446,7 @@ class DatabaseMethods:
         """
 
         if include_synonyms:
-            sql_query = text("""
+            sql_query = _cached_text("""
                 WITH matching_terms AS (
                     SELECT DISTINCT ot.id, ot.curie, ot.name, ot.namespace, ot.definition, ot.ontologytermtype
                     FROM ontologyterm ot
@@ -2314,7 +2470,7 @@ class DatabaseMethods:
                 ORDER BY mt.name
             """)
         else:
-            sql_query = text("""
+            sql_query = _cached_text("""
                 SELECT
                     ot.curie,
                     ot.name,
@@ -2331,18 +2487,7 @@ class DatabaseMethods:
 
         rows = session.execute(sql_query, {"search_exact": search_upper, "ontology_type": ontology_type}).fetchall()
 
-        return [
-            OntologyTermResult(
-                curie=row[0],
-                name=row[1],
-                namespace=row[2] or "",
-                definition=row[3],
-                ontology_type=row[4],
-                synonyms=row[5] or [],
-                match_type="exact",
-            )
-            for row in rows
-        ]
+        return [_ontology_result_from_row(row, "exact") for row in rows]
 
     def _search_ontology_prefix(
         self,
@@ -2377,7 +2522,7 @@ class DatabaseMethods:
             exclude_clause = ""
 
         if include_synonyms:
-            sql_query = text(f"""
+            sql_query = _cached_text(f"""
                 WITH matching_terms AS (
                     SELECT DISTINCT ot.id, ot.curie, ot.name, ot.namespace, ot.definition, ot.ontologytermtype
                     FROM ontologyterm ot
@@ -2404,7 +2549,7 @@ class DatabaseMethods:
                 ORDER BY mt.name
             """)
         else:
-            sql_query = text(f"""
+            sql_query = _cached_text(f"""
                 SELECT
                     ot.curie,
                     ot.name,
@@ -2433,18 +2578,7 @@ class DatabaseMethods:
 
         rows = session.execute(sql_query, params).fetchall()
 
-        return [
-            OntologyTermResult(
-                curie=row[0],
-                name=row[1],
-                namespace=row[2] or "",
-                definition=row[3],
-                ontology_type=row[4],
-                synonyms=row[5] or [],
-                match_type="prefix",
-            )
-            for row in rows
-        ]
+        return [_ontology_result_from_row(row, "prefix") for row in rows]
 
     def _search_ontology_contains(
         self,
@@ -2457,8 +2591,11 @@ class DatabaseMethods:
     ) -> List["OntologyTermResult"]:
         """Tier 3: Contains match search for ontology terms.
 
-        Uses UPPER(name) LIKE '%PATTERN%' which CANNOT use B-tree index.
-        Requires sequential scan. Expected performance: ~990ms
+        Uses UPPER(name) LIKE '%PATTERN%', which cannot use the B-tree index but is
+        served by the pg_trgm GIN indexes (ontologyterm_name_trgm_idx /
+        synonym_name_trgm_idx) that Tier 4 also relies on. Name and synonym matches
+        are separate UNION branches so each can use its own index; a single OR across
+        the synonym join forces a sequential scan (~990ms).
 
         Args:
             session: SQLAlchemy session
@@ -2473,43 +2610,48 @@ class DatabaseMethods:
         """
 
         if include_synonyms:
-            # Build exclusion clause for CTE query (use mt.curie since we're in the outer query)
             if exclude_curies:
-                exclude_clause = "AND mt.curie NOT IN :exclude_curies"
+                exclude_clause = "AND ot.curie NOT IN :exclude_curies"
             else:
                 exclude_clause = ""
 
-            sql_query = text(f"""
-                WITH matching_terms AS MATERIALIZED (
-                    SELECT DISTINCT
-                        ot.id,
-                        ot.curie,
-                        ot.name,
-                        ot.namespace,
-                        ot.definition,
-                        ot.ontologytermtype
+            # matched_ids UNIONs a name branch and a synonym branch so each trigram GIN
+            # index is usable; terms whose name starts with the pattern belong to the
+            # prefix tier and are left out of both branches.
+            sql_query = _cached_text(f"""
+                WITH matched_ids AS (
+                    SELECT ot.id
                     FROM ontologyterm ot
-                    LEFT JOIN ontologyterm_synonym ots ON ot.id = ots.ontologyterm_id
-                    LEFT JOIN synonym s ON ots.synonyms_id = s.id
                     WHERE ot.ontologytermtype = :ontology_type
                     AND ot.obsolete = false
-                    AND (UPPER(ot.name) LIKE :search_contains OR UPPER(s.name) LIKE :search_contains)
-                    AND (UPPER(ot.name) NOT LIKE :search_starts AND (s.name IS NULL OR UPPER(s.name) NOT LIKE :search_starts))
+                    AND UPPER(ot.name) LIKE :search_contains
+                    AND UPPER(ot.name) NOT LIKE :search_starts
+                    UNION
+                    SELECT ot.id
+                    FROM synonym s
+                    JOIN ontologyterm_synonym ots ON ots.synonyms_id = s.id
+                    JOIN ontologyterm ot ON ot.id = ots.ontologyterm_id
+                    WHERE ot.ontologytermtype = :ontology_type
+                    AND ot.obsolete = false
+                    AND UPPER(s.name) LIKE :search_contains
+                    AND UPPER(s.name) NOT LIKE :search_starts
+                    AND UPPER(ot.name) NOT LIKE :search_starts
                 )
                 SELECT
-                    mt.curie,
-                    mt.name,
-                    mt.namespace,
-                    mt.definition,
-                    mt.ontologytermtype,
+                    ot.curie,
+                    ot.name,
+                    ot.namespace,
+                    ot.definition,
+                    ot.ontologytermtype,
                     ARRAY_AGG(DISTINCT s.name) FILTER (WHERE s.name IS NOT NULL) as synonyms
-                FROM matching_terms mt
-                LEFT JOIN ontologyterm_synonym ots ON mt.id = ots.ontologyterm_id
+                FROM ontologyterm ot
+                JOIN matched_ids mi ON mi.id = ot.id
+                LEFT JOIN ontologyterm_synonym ots ON ot.id = ots.ontologyterm_id
                 LEFT JOIN synonym s ON ots.synonyms_id = s.id
                 WHERE true
                 {exclude_clause}
-                GROUP BY mt.curie, mt.name, mt.namespace, mt.definition, mt.ontologytermtype
-                ORDER BY mt.name
+                GROUP BY ot.curie, ot.name, ot.namespace, ot.definition, ot.ontologytermtype
+                ORDER BY ot.name
                 LIMIT :limit
             """)
         else:
@@ -2519,7 +2661,7 @@ class DatabaseMethods:
             else:
                 exclude_clause = ""
 
-            sql_query = text(f"""
+            sql_query = _cached_text(f"""
                 SELECT
                     ot.curie,
                     ot.name,
@@ -2548,18 +2690,7 @@ class DatabaseMethods:
 
         rows = session.execute(sql_query, params).fetchall()
 
-        return [
-            OntologyTermResult(
-                curie=row[0],
-                name=row[1],
-                namespace=row[2] or "",
-                definition=row[3],
-                ontology_type=row[4],
-                synonyms=row[5] or [],
-                match_type="contains",
-            )
-            for row in rows
-        ]
+        return [_ontology_result_from_row(row, "contains") for row in rows]
 
     def _search_ontology_trigram(
         self,
@@ -2632,7 +2763,7 @@ class DatabaseMethods:
             # matched_ids UNIONs two index-scannable branches so both trigram GIN
             # indexes are usable; the outer query then re-joins synonyms only for the
             # matched terms to aggregate names and compute scores.
-            sql_query = text(f"""
+            sql_query = _cached_text(f"""
                 WITH matched_ids AS (
                     SELECT ot.id
                     FROM ontologyterm ot
@@ -2676,7 +2807,7 @@ class DatabaseMethods:
             else:
                 exclude_clause = ""
 
-            sql_query = text(f"""
+            sql_query = _cached_text(f"""
                 SELECT
                     ot.curie,
                     ot.name,
@@ -2708,7 +2839,7 @@ class DatabaseMethods:
         # resets at transaction end -- the session shares one transaction across tiers
         # (sessionmaker autocommit=False), so this persists to the query execute below
         # and never leaks onto a pooled connection.
-        threshold_sql = text(
+        threshold_sql = _cached_text(
             "SELECT set_config('pg_trgm.word_similarity_threshold', :wst, true)"
         )
 
@@ -2742,7 +2873,7 @@ class DatabaseMethods:
                     namespace=row[2] or "",
                     definition=row[3],
                     ontology_type=row[4],
-                    synonyms=row[5] or [],
+                    synonyms=row[5] or (),
                     match_score=match_score,
                     matched_field=matched_field,
                     match_type="trigram",
@@ -1,36 +1,63 @@
 """Data models for AGR Curation API Client."""
 
 import os
-from typing import Optional, Dict, Any, List, Union
-from pydantic import BaseModel, Field, HttpUrl, field_validator, ConfigDict, model_validator
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Union
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    Field,
+    HttpUrl,
+    field_serializer,
+    ConfigDict,
+    model_validator,
+)
 from datetime import datetime, timedelta
+from typing_extensions import Annotated
+
+_DEFAULT_BASE_URL = "https://curation.alliancegenome.org/api"
+
+
+@lru_cache(maxsize=32)
+def _parse_http_url(url: str) -> HttpUrl:
+    """Parse a URL string once; HttpUrl instances are immutable and safe to share."""
+    return HttpUrl(url)
+
+
+def _cached_http_url(v: Any) -> Any:
+    """Route URL strings through the parse cache before field validation."""
+    return _parse_http_url(v) if isinstance(v, str) else v
+
+
+def _positive_timedelta(v: timedelta) -> timedelta:
+    """Ensure timedelta is positive."""
+    if v.total_seconds() <= 0:
+        raise ValueError("Timeout and retry_delay must be positive")
+    return v
+
+
+PositiveTimedelta = Annotated[timedelta, AfterValidator(_positive_timedelta)]
 
 
 class APIConfig(BaseModel):
     """Configuration for AGR Curation API client."""
 
-    base_url: HttpUrl = Field(
-        default_factory=lambda: HttpUrl(os.getenv("ATEAM_API_URL", "https://curation.alliancegenome.org/api")),
+    base_url: Annotated[HttpUrl, BeforeValidator(_cached_http_url)] = Field(
+        default_factory=lambda: _parse_http_url(os.getenv("ATEAM_API_URL", _DEFAULT_BASE_URL)),
         description="Base URL for the A-Team Curation API",
     )
     auth_token: Optional[str] = Field(None, description="Okta bearer token for authentication")
-    timeout: timedelta = Field(default=timedelta(seconds=30), description="Request timeout")
+    timeout: PositiveTimedelta = Field(default=timedelta(seconds=30), description="Request timeout")
     max_retries: int = Field(3, ge=0, description="Maximum number of retry attempts")
-    retry_delay: timedelta = Field(default=timedelta(seconds=1), description="Delay between retry attempts")
+    retry_delay: PositiveTimedelta = Field(default=timedelta(seconds=1), description="Delay between retry attempts")
     verify_ssl: bool = Field(True, description="Whether to verify SSL certificates")
     headers: Dict[str, str] = Field(default_factory=dict, description="Additional headers to include in requests")
 
-    @field_validator("timeout", "retry_delay")
-    def validate_timedelta(cls, v: timedelta) -> timedelta:
-        """Ensure timedelta is positive."""
-        if v.total_seconds() <= 0:
-            raise ValueError("Timeout and retry_delay must be positive")
-        return v
-
-    class Config:
-        """Pydantic config."""
-
-        json_encoders = {timedelta: lambda v: v.total_seconds()}
+    @field_serializer("timeout", "retry_delay", when_used="json")
+    def serialize_timedelta(self, v: timedelta) -> float:
+        """Serialize timedeltas as seconds in JSON output."""
+        return v.total_seconds()
 
 
 class APIResponse(BaseModel):
@@ -42,11 +69,34 @@ class APIResponse(BaseModel):
     entities: Optional[List[Dict[str, Any]]] = None
     aggregations: Optional[Dict[str, Any]] = None
 
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+    @classmethod
+    def parse_response(cls, raw: Union[str, bytes]) -> "APIResponse":
+        """Parse a raw JSON response body without building an intermediate dict."""
+        return cls.model_validate_json(raw)
+
 
 # API Response Models that match actual AGR Curation API responses
 
 
-class Person(BaseModel):
+class _APIModel(BaseModel):
+    """Base class for models built from API and database records."""
+
+    model_config = ConfigDict(populate_by_name=True, extra="allow")
+
+
+class _ResultModel(_APIModel):
+    """Base class for results the client builds from its own database queries.
+
+    Their inputs are fully known, so unknown keys are dropped instead of
+    being collected into ``__pydantic_extra__``.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class Person(_APIModel):
     """Person model for createdBy/updatedBy fields."""
 
     id: Optional[int] = None
@@ -54,10 +104,8 @@ class Person(BaseModel):
     dateCreated: Optional[datetime] = None
     dateUpdated: Optional[datetime] = None
 
-    model_config = ConfigDict(extra="allow")
-
 
-class ResourceDescriptorPage(BaseModel):
+class ResourceDescriptorPage(_APIModel):
     """Resource descriptor page model."""
 
     id: Optional[int] = None
@@ -66,10 +114,8 @@ class ResourceDescriptorPage(BaseModel):
     name: Optional[str] = None
     url: Optional[str] = None
 
-    model_config = ConfigDict(extra="allow")
 
-
-class CrossReference(BaseModel):
+class CrossReference(_APIModel):
     """Cross reference model that matches API response."""
 
     id: Optional[int] = None
@@ -88,10 +134,8 @@ class CrossReference(BaseModel):
     referencedCurie: Optional[str] = None
     url: Optional[str] = None
 
-    model_config = ConfigDict(extra="allow")
-
 
-class DataProvider(BaseModel):
+class DataProvider(_APIModel):
     """Data provider model that matches API response."""
 
     type: Optional[str] = None
@@ -104,8 +148,6 @@ class DataProvider(BaseModel):
     sourceOrganization: Optional[str] = None
     crossReference: Optional[CrossReference] = None
 
-    model_config = ConfigDict(extra="allow")
-
     @model_validator(mode="before")
     @classmethod
     def extract_source_organization(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -115,7 +157,7 @@ class DataProvider(BaseModel):
         return values
 
 
-class NameType(BaseModel):
+class NameType(_APIModel):
     """Name type model."""
 
     id: Optional[int] = None
@@ -124,10 +166,8 @@ class NameType(BaseModel):
     name: Optional[str] = None
     definition: Optional[str] = None
 
-    model_config = ConfigDict(extra="allow")
-
 
-class SynonymScope(BaseModel):
+class SynonymScope(_APIModel):
     """Synonym scope model."""
 
     id: Optional[int] = None
@@ -135,10 +175,8 @@ class SynonymScope(BaseModel):
     obsolete: Optional[bool] = None
     name: Optional[str] = None
 
-    model_config = ConfigDict(extra="allow")
 
-
-class SlotAnnotation(BaseModel):
+class SlotAnnotation(_APIModel):
     """Slot annotation model that matches API response."""
 
     id: Optional[int] = None
@@ -152,10 +190,8 @@ class SlotAnnotation(BaseModel):
     nameType: Optional[Union[str, NameType]] = None
     synonymScope: Optional[Union[str, SynonymScope]] = None
 
-    model_config = ConfigDict(extra="allow")
-
 
-class SecondaryId(BaseModel):
+class SecondaryId(_APIModel):
     """Secondary ID model."""
 
     id: Optional[int] = None
@@ -165,10 +201,80 @@ class SecondaryId(BaseModel):
     dbDateUpdated: Optional[datetime] = None
     secondaryId: Optional[str] = None
 
-    model_config = ConfigDict(extra="allow")
 
+class Reference(_APIModel):
+    """Reference (publication) model for entity reference lists."""
+
+    id: Optional[int] = None
+    curie: Optional[str] = None
+    shortCitation: Optional[str] = None
+    crossReferences: Optional[List[CrossReference]] = None
+
+    obsolete: Optional[bool] = None
+    internal: Optional[bool] = None
+
+
+class NCBITaxonTerm(_APIModel):
+    """NCBI Taxon term model that matches API response.
+
+    NCBITaxonTerm inherits from OntologyTerm in the AGR schema.
+    This represents taxonomic species from the NCBI Taxonomy database.
+    """
+
+    type: Optional[str] = None
+    id: Optional[int] = None
+    curie: Optional[str] = None
+
+    name: Optional[str] = None
+    definition: Optional[str] = None
+    namespace: Optional[str] = None
+
+    # Additional fields from OntologyTerm (tuples, so the frozen model cannot be changed in place)
+    dbkey: Optional[str] = None
+    definitionUrls: Optional[Tuple[str, ...]] = None
+    crossReferences: Optional[Tuple[CrossReference, ...]] = None
+    synonyms: Optional[Tuple[str, ...]] = None
+    subsets: Optional[Tuple[str, ...]] = None
+    secondaryIdentifiers: Optional[Tuple[str, ...]] = None
+
+    # Hierarchy fields (read-only tuples; these can hold thousands of CURIEs)
+    ancestors: Optional[Tuple[str, ...]] = None
+    descendants: Optional[Tuple[str, ...]] = None
+    childCount: Optional[int] = None
+    descendantCount: Optional[int] = None
+
+    obsolete: Optional[bool] = None
+    internal: Optional[bool] = None
+
+    model_config = ConfigDict(frozen=True)
+
+    def __hash__(self) -> int:
+        """Hash the field values; CrossReference is a mutable model, so cross references are left out."""
+        return hash(tuple(v for k, v in self.__dict__.items() if k != "crossReferences"))
+
+
+class OntologyTerm(_APIModel):
+    """Ontology term model that matches API response."""
+
+    type: Optional[str] = None
+    id: Optional[int] = None
+    curie: Optional[str] = None
+
+    name: Optional[str] = None
+    definition: Optional[str] = None
+    namespace: Optional[str] = None
+
+    obsolete: Optional[bool] = None
+    internal: Optional[bool] = None
 
-class Gene(BaseModel):
+    childCount: Optional[int] = None
+    descendantCount: Optional[int] = None
+    ancestors: Optional[Tuple[str, ...]] = None
+
+    model_config = ConfigDict(frozen=True)
+
+
+class Gene(_APIModel):
     """Gene model that matches the actual API response structure."""
 
     # Primary fields that may differ from schema
@@ -189,19 +295,19 @@ class Gene(BaseModel):
     geneSystematicName: Optional[SlotAnnotation] = None
     geneSynonyms: Optional[List[SlotAnnotation]] = None
     geneSecondaryIds: Optional[List[Union[str, SecondaryId]]] = None
-    geneType: Optional[Any] = None  # Can be string or object
+    # Can be a CURIE string or an object; objects that do not fit OntologyTerm stay dicts
+    geneType: Optional[Union[str, OntologyTerm, Dict[str, Any]]] = Field(None, union_mode="left_to_right")
 
     # Related entities
     crossReferences: Optional[List[CrossReference]] = None
     dataProvider: Optional[DataProvider] = None
-    taxon: Optional[Any] = None  # Can be string or object
+    # Can be a CURIE string or an object; objects that do not fit NCBITaxonTerm stay dicts
+    taxon: Optional[Union[str, NCBITaxonTerm, Dict[str, Any]]] = Field(None, union_mode="left_to_right")
 
     # Status fields
     obsolete: Optional[bool] = None
     internal: Optional[bool] = None
 
-    model_config = ConfigDict(extra="allow")
-
     @model_validator(mode="before")
     @classmethod
     def handle_curie(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -211,7 +317,7 @@ class Gene(BaseModel):
         return values
 
 
-class Allele(BaseModel):
+class Allele(_APIModel):
     """Allele model that matches API response."""
 
     type: Optional[str] = None
@@ -230,7 +336,7 @@ class Allele(BaseModel):
 
     crossReferences: Optional[List[CrossReference]] = None
     dataProvider: Optional[DataProvider] = None
-    taxon: Optional[Any] = None
+    taxon: Optional[Union[str, NCBITaxonTerm, Dict[str, Any]]] = Field(None, union_mode="left_to_right")
 
     obsolete: Optional[bool] = None
     internal: Optional[bool] = None
@@ -238,9 +344,7 @@ class Allele(BaseModel):
     isExtrachromosomal: Optional[bool] = None
     isIntegrated: Optional[bool] = None
     laboratoryOfOrigin: Optional[Any] = None
-    references: Optional[List[Any]] = None
-
-    model_config = ConfigDict(extra="allow")
+    references: Optional[List[Union[str, int, Reference]]] = None  # CURIEs, reference IDs or objects
 
     @model_validator(mode="before")
     @classmethod
@@ -251,7 +355,7 @@ class Allele(BaseModel):
         return values
 
 
-class Species(BaseModel):
+class Species(_APIModel):
     """Species model that matches API response."""
 
     type: Optional[str] = None
@@ -265,99 +369,46 @@ class Species(BaseModel):
     genomeAssembly: Optional[str] = None
     phylogeneticOrder: Optional[int] = None
 
-    taxon: Optional[Any] = None
-
-    obsolete: Optional[bool] = None
-    internal: Optional[bool] = None
-
-    model_config = ConfigDict(extra="allow")
-
-
-class NCBITaxonTerm(BaseModel):
-    """NCBI Taxon term model that matches API response.
-
-    NCBITaxonTerm inherits from OntologyTerm in the AGR schema.
-    This represents taxonomic species from the NCBI Taxonomy database.
-    """
-
-    type: Optional[str] = None
-    id: Optional[int] = None
-    curie: Optional[str] = None
-
-    name: Optional[str] = None
-    definition: Optional[str] = None
-    namespace: Optional[str] = None
-
-    # Additional fields from OntologyTerm
-    dbkey: Optional[str] = None
-    definitionUrls: Optional[List[str]] = None
-    crossReferences: Optional[List[CrossReference]] = None
-    synonyms: Optional[List[str]] = None
-    subsets: Optional[List[str]] = None
-    secondaryIdentifiers: Optional[List[str]] = None
-
-    # Hierarchy fields
-    ancestors: Optional[List[str]] = None
-    descendants: Optional[List[str]] = None
-    childCount: Optional[int] = None
-    descendantCount: Optional[int] = None
+    taxon: Optional[Union[str, NCBITaxonTerm, Dict[str, Any]]] = Field(None, union_mode="left_to_right")
 
     obsolete: Optional[bool] = None
     internal: Optional[bool] = None
 
-    model_config = ConfigDict(extra="allow")
 
-
-class OntologyTerm(BaseModel):
-    """Ontology term model that matches API response."""
-
-    type: Optional[str] = None
-    id: Optional[int] = None
-    curie: Optional[str] = None
-
-    name: Optional[str] = None
-    definition: Optional[str] = None
-    namespace: Optional[str] = None
-
-    obsolete: Optional[bool] = None
-    internal: Optional[bool] = None
-
-    childCount: Optional[int] = None
-    descendantCount: Optional[int] = None
-    ancestors: Optional[List[str]] = None
-
-    model_config = ConfigDict(extra="allow")
-
-
-class OntologyTermResult(BaseModel):
+class OntologyTermResult(_ResultModel):
     """Ontology term result from database search.
 
     Used for direct database queries that include synonym information.
     This is separate from OntologyTerm which represents API responses.
+    Results are frozen (and hashable) because DatabaseMethods shares cached
+    search results between callers.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     curie: str = Field(..., description="Ontology term CURIE (e.g., 'WBbt:0005062')")
     name: str = Field(..., description="Canonical term name")
     namespace: str = Field(..., description="Ontology namespace")
     definition: Optional[str] = Field(None, description="Term definition")
     ontology_type: str = Field(..., description="Ontology term type (e.g., 'WBBTTerm', 'GOTerm')")
-    synonyms: List[str] = Field(default_factory=list, description="List of synonyms")
+    synonyms: Tuple[str, ...] = Field(default=(), description="Synonyms of the term")
     match_score: Optional[float] = Field(
         None,
         description="Fuzzy match score (pg_trgm word_similarity, 0-1). Set for trigram matches; None for exact/prefix/contains.",
     )
-    matched_field: Optional[str] = Field(
-        None, description="Which field produced the match: 'name' or 'synonym'."
-    )
+    matched_field: Optional[str] = Field(None, description="Which field produced the match: 'name' or 'synonym'.")
     match_type: Optional[str] = Field(
         None,
         description="How the term matched: 'exact' | 'prefix' | 'contains' | 'trigram'.",
     )
 
-    model_config = ConfigDict(extra="allow")
+    @property
+    def name_lower(self) -> str:
+        """Lower-cased term name for case-insensitive matching."""
+        return self.name.lower()
 
 
-class ReferenceResult(BaseModel):
+class ReferenceResult(_ResultModel):
     """Reference result from database search.
 
     This compact model is intentionally shared by curation-DB and
@@ -374,10 +425,8 @@ class ReferenceResult(BaseModel):
     source: str = Field(..., description="Backing database source, such as curation_db or literature_db")
     obsolete: Optional[bool] = Field(None, description="Whether the reference is obsolete when known")
 
-    model_config = ConfigDict(extra="allow")
-
 
-class VocabularyTermResult(BaseModel):
+class VocabularyTermResult(_ResultModel):
     """Vocabulary term result from curation database search."""
 
     id: int = Field(..., description="Internal vocabularyterm ID")
@@ -389,10 +438,8 @@ class VocabularyTermResult(BaseModel):
     obsolete: bool = Field(False, description="Whether the vocabulary term is obsolete")
     synonyms: List[str] = Field(default_factory=list, description="Vocabulary term synonyms")
 
-    model_config = ConfigDict(extra="allow")
 
-
-class ExpressionAnnotation(BaseModel):
+class ExpressionAnnotation(_APIModel):
     """Expression annotation model from A-Team curation API."""
 
     curie: Optional[str] = Field(None, description="Compact URI")
@@ -401,10 +448,8 @@ class ExpressionAnnotation(BaseModel):
     whenExpressedStageName: Optional[str] = Field(None, description="Human-readable stage name")
     whereExpressedStatement: Optional[str] = Field(None, description="Where expressed statement")
 
-    model_config = ConfigDict(extra="allow")
-
 
-class AffectedGenomicModel(BaseModel):
+class AffectedGenomicModel(_APIModel):
     """Affected Genomic Model (AGM) for fish and other organisms from A-Team curation API."""
 
     id: Optional[int] = None
@@ -431,10 +476,8 @@ class AffectedGenomicModel(BaseModel):
     parentalPopulations: Optional[List[Dict[str, Any]]] = None
     sequenceTargetingReagents: Optional[List[Dict[str, Any]]] = None
 
-    model_config = ConfigDict(extra="allow")
 
-
-class DiseaseAnnotation(BaseModel):
+class DiseaseAnnotation(_APIModel):
     """Disease annotation model for gene, allele, or AGM disease associations.
 
     Represents annotations asserting associations between biological entities
@@ -506,5 +549,3 @@ class DiseaseAnnotation(BaseModel):
     date_updated: Optional[datetime] = Field(None, description="Date annotation was last updated")
     obsolete: bool = Field(False, description="Whether annotation is obsolete")
     internal: bool = Field(False, description="Whether annotation is internal")
-
-    model_config = ConfigDict(extra="allow")
@@ -6,25 +6,51 @@ converting from generic dictionaries to strongly-typed Pydantic models.
 """
 
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from typing import Any, Optional, List
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+from typing_extensions import Annotated
+
+
+def _extract_user_id(v: Any) -> Any:
+    """Reduce a createdBy/updatedBy person object to its user identifier.
+
+    The API returns audit users either as a plain identifier or as a full
+    person object; the ``None``/``str`` cases are by far the most common, so
+    they are returned before any dict handling. A person object without a
+    ``uniqueId`` or ``id`` yields ``None``.
+    """
+    if v is None or isinstance(v, str):
+        return v
+    if isinstance(v, dict):
+        user_id = v.get("uniqueId") or v.get("id")
+        return str(user_id) if user_id is not None else None
+    return v
+
+
+UserRef = Annotated[Optional[str], BeforeValidator(_extract_user_id)]
 
 
 # Base Models
-class SlotAnnotation(BaseModel):
+class _AGRModel(BaseModel):
+    """Shared base so every nested model accepts both API aliases and field names.
+
+    Keys the nested models do not declare are ignored rather than stored.
+    """
+
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+
+class SlotAnnotation(_AGRModel):
     """Base class for slot annotations."""
 
     evidence: Optional[List[str]] = Field(None, description="Supporting evidence")
     internal: Optional[bool] = Field(False, description="Whether annotation is internal")
     obsolete: Optional[bool] = Field(False, description="Whether annotation is obsolete")
-    created_by: Optional[str] = Field(None, alias="createdBy")
+    created_by: UserRef = Field(None, alias="createdBy")
     date_created: Optional[datetime] = Field(None, alias="dateCreated")
-    updated_by: Optional[str] = Field(None, alias="updatedBy")
+    updated_by: UserRef = Field(None, alias="updatedBy")
     date_updated: Optional[datetime] = Field(None, alias="dateUpdated")
 
-    class Config:
-        populate_by_name = True
-
 
 class NameSlotAnnotation(SlotAnnotation):
     """Name-related slot annotation."""
@@ -35,12 +61,9 @@ class NameSlotAnnotation(SlotAnnotation):
     synonym_scope: Optional[str] = Field(None, alias="synonymScope")
     synonym_url: Optional[str] = Field(None, alias="synonymUrl")
 
-    class Config:
-        populate_by_name = True
-
 
 # Taxon/Species Models
-class NCBITaxonTerm(BaseModel):
+class NCBITaxonTerm(_AGRModel):
     """NCBI Taxon term."""
 
     curie: str = Field(..., description="NCBI Taxon ID (e.g., NCBITaxon:9606)")
@@ -50,12 +73,9 @@ class NCBITaxonTerm(BaseModel):
     internal: Optional[bool] = Field(False)
     obsolete: Optional[bool] = Field(False)
 
-    class Config:
-        populate_by_name = True
-
 
 # Ontology Term Models
-class SOTerm(BaseModel):
+class SOTerm(_AGRModel):
     """Sequence Ontology term."""
 
     curie: str = Field(..., description="SO term ID (e.g., SO:0000704)")
@@ -64,11 +84,8 @@ class SOTerm(BaseModel):
     namespace: Optional[str] = Field(None)
     obsolete: Optional[bool] = Field(False)
 
-    class Config:
-        populate_by_name = True
 
-
-class GOTerm(BaseModel):
+class GOTerm(_AGRModel):
     """Gene Ontology term."""
 
     curie: str = Field(..., description="GO term ID (e.g., GO:0008150)")
@@ -77,11 +94,8 @@ class GOTerm(BaseModel):
     namespace: Optional[str] = Field(None)
     obsolete: Optional[bool] = Field(False)
 
-    class Config:
-        populate_by_name = True
-
 
-class VocabularyTerm(BaseModel):
+class VocabularyTerm(_AGRModel):
     """Controlled vocabulary term."""
 
     name: str = Field(..., description="Term name")
@@ -90,12 +104,9 @@ class VocabularyTerm(BaseModel):
     namespace: Optional[str] = Field(None)
     obsolete: Optional[bool] = Field(False)
 
-    class Config:
-        populate_by_name = True
-
 
 # Cross Reference Models
-class CrossReference(BaseModel):
+class CrossReference(_AGRModel):
     """Cross reference to external database."""
 
     referenced_curie: str = Field(..., alias="referencedCurie", description="External database ID")
@@ -106,11 +117,8 @@ class CrossReference(BaseModel):
     internal: Optional[bool] = Field(False)
     obsolete: Optional[bool] = Field(False)
 
-    class Config:
-        populate_by_name = True
 
-
-class DataProvider(BaseModel):
+class DataProvider(_AGRModel):
     """Data provider information."""
 
     source_organization: str = Field(
@@ -118,20 +126,14 @@ class DataProvider(BaseModel):
     )
     cross_reference: Optional[CrossReference] = Field(None, alias="crossReference")
 
-    class Config:
-        populate_by_name = True
-
 
 # Reference Models
-class PublicationRef(BaseModel):
+class PublicationRef(_AGRModel):
     """Reference to a publication."""
 
     curie: Optional[str] = Field(None, description="Reference ID")
     cross_references: Optional[List[CrossReference]] = Field(None, alias="crossReferences")
 
-    class Config:
-        populate_by_name = True
-
 
 # Gene-specific Models
 class GeneSymbolSlotAnnotation(NameSlotAnnotation):
@@ -163,9 +165,6 @@ class GeneSecondaryIdSlotAnnotation(SlotAnnotation):
 
     secondary_id: str = Field(..., alias="secondaryId")
 
-    class Config:
-        populate_by_name = True
-
 
 # Allele-specific Models
 class AlleleSymbolSlotAnnotation(NameSlotAnnotation):
@@ -187,7 +186,7 @@ class AlleleSynonymSlotAnnotation(NameSlotAnnotation):
 
 
 # Agent/Person Models
-class Laboratory(BaseModel):
+class Laboratory(_AGRModel):
     """Laboratory information."""
 
     abbreviation: str = Field(..., description="Lab abbreviation")
@@ -195,11 +194,8 @@ class Laboratory(BaseModel):
     pi_name: Optional[str] = Field(None, alias="piName", description="Principal investigator")
     institution: Optional[str] = Field(None)
 
-    class Config:
-        populate_by_name = True
-
 
-class Person(BaseModel):
+class Person(_AGRModel):
     """Person information."""
 
     unique_id: Optional[str] = Field(None, alias="uniqueId")
@@ -208,12 +204,9 @@ class Person(BaseModel):
     email: Optional[str] = Field(None)
     orcid: Optional[str] = Field(None)
 
-    class Config:
-        populate_by_name = True
-
 
 # Association Models
-class GeneGenomicLocationAssociation(BaseModel):
+class GeneGenomicLocationAssociation(_AGRModel):
     """Association between a gene and its genomic location."""
 
     gene_association_subject: Optional[str] = Field(None, alias="geneAssociationSubject")
@@ -225,11 +218,8 @@ class GeneGenomicLocationAssociation(BaseModel):
     assembly: Optional[str] = Field(None)
     evidence: Optional[List[PublicationRef]] = Field(None)
 
-    class Config:
-        populate_by_name = True
 
-
-class AlleleGeneAssociation(BaseModel):
+class AlleleGeneAssociation(_AGRModel):
     """Association between an allele and a gene."""
 
     allele_association_subject: Optional[str] = Field(None, alias="alleleAssociationSubject")
@@ -237,18 +227,12 @@ class AlleleGeneAssociation(BaseModel):
     relation: Optional[str] = Field(None, description="Relationship type")
     evidence: Optional[List[PublicationRef]] = Field(None)
 
-    class Config:
-        populate_by_name = True
-
 
 # Note Models
-class Note(BaseModel):
+class Note(_AGRModel):
     """Note or comment."""
 
     note_type: Optional[VocabularyTerm] = Field(None, alias="noteType")
     free_text: str = Field(..., alias="freeText", description="Note content")
     evidence: Optional[List[PublicationRef]] = Field(None)
     internal: Optional[bool] = Field(False)
-
-    class Config:
-        populate_by_name = True
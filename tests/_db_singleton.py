@@ -0,0 +1,63 @@
+"""Shared DatabaseMethods instance for the database integration tests.
+
+Building DatabaseMethods creates its own SQLAlchemy engine and connection
+pool, so the integration tests share one instance (exposed as the session
+``db`` fixture in conftest.py) instead of each opening their own connections.
+The instance enables the ontology search cache, so searches made through
+cached_search() that many tests repeat only reach the database once.
+assert_ontology_results() is the shared structure check for search results.
+"""
+
+import atexit
+from functools import lru_cache
+from typing import List, Optional
+
+from pydantic import TypeAdapter
+
+from agr_curation_api.db_methods import DatabaseMethods
+from agr_curation_api.models import OntologyTermResult
+
+# Built once; validate_python() checks every item of a dumped search result list in one call
+ONTOLOGY_RESULTS = TypeAdapter(List[OntologyTermResult])
+
+
+@lru_cache(maxsize=1)
+def get_db() -> DatabaseMethods:
+    """Return the process-wide DatabaseMethods instance, closing it at exit.
+
+    Under pytest-xdist each worker process builds its own instance.
+    """
+    db = DatabaseMethods(ontology_search_cache_size=1024)
+    atexit.register(db.close)
+    return db
+
+
+def cached_search(
+    term: str, ontology_type: str, exact_match: bool = False, include_synonyms: bool = True, limit: int = 20
+) -> List[OntologyTermResult]:
+    """Run search_ontology_terms() on the shared instance.
+
+    The shared instance memoizes identical searches, so tests that repeat a
+    (term, ontology_type, flags) query only reach the database once.
+    """
+    return get_db().search_ontology_terms(
+        term=term,
+        ontology_type=ontology_type,
+        exact_match=exact_match,
+        include_synonyms=include_synonyms,
+        limit=limit,
+    )
+
+
+def assert_ontology_results(results: List[OntologyTermResult], ontology_type: Optional[str] = None) -> None:
+    """Check that every result is a valid OntologyTermResult, of ontology_type when given.
+
+    validate_python() accepts existing model instances without re-checking their
+    fields (and search rows are built with model_construct), so the results are
+    validated from their dumped field values, which enforces the required
+    curie, name, namespace and ontology_type.
+    """
+    assert all(isinstance(r, OntologyTermResult) for r in results)
+    ONTOLOGY_RESULTS.validate_python([r.model_dump() for r in results])
+    if ontology_type is not None:
+        assert all(r.ontology_type == ontology_type for r in results)
@@ -0,0 +1,55 @@
+"""Shared pytest configuration for the AGR Curation API client tests."""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from tests._db_singleton import get_db
+
+DB_SKIP_REASON = "Database integration tests require PERSISTENT_STORE_DB_* environment variables"
+
+
+def pytest_configure(config):
+    """Register the marker used by tests that need the curation database."""
+    config.addinivalue_line("markers", "db_integration: test runs against the curation database")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip database integration tests at collection time when no database is configured."""
+    if os.getenv("PERSISTENT_STORE_DB_HOST"):
+        return
+
+    skip_db = pytest.mark.skip(reason=DB_SKIP_REASON)
+    for item in items:
+        if "db_integration" in item.keywords:
+            item.add_marker(skip_db)
+
+
+@pytest.fixture(scope="session")
+def db():
+    """DatabaseMethods instance shared by every database integration test.
+
+    The database is probed once; if it is configured but unreachable, every
+    test that needs it is skipped instead of failing on its own connection attempt.
+    """
+    database = get_db()
+    try:
+        # A throwaway engine with its own connect_timeout: libpq otherwise waits on an
+        # unreachable host until the OS gives up on the TCP connect
+        probe = create_engine(database.config.connection_string, connect_args={"connect_timeout": 10})
+        try:
+            with probe.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        finally:
+            probe.dispose()
+    except Exception as exc:
+        pytest.skip(f"Database is unreachable: {exc}")
+    return database
+
+
+@pytest.fixture(autouse=True)
+def _require_db(request):
+    """Route every db_integration test through the probed session fixture."""
+    if request.node.get_closest_marker("db_integration"):
+        request.getfixturevalue("db")
@@ -6,152 +6,68 @@ against production database.
 """
 
 import pytest
-import os
-from agr_curation_api.db_methods import DatabaseMethods
+from concurrent.futures import ThreadPoolExecutor
 
-pytestmark = pytest.mark.skipif(
-    not os.getenv("PERSISTENT_STORE_DB_HOST"),
-    reason="Database integration tests require PERSISTENT_STORE_DB_* environment variables",
-)
+from tests._db_singleton import assert_ontology_results
 
+# Skipped at collection time (see conftest.py) unless database credentials are available
+pytestmark = pytest.mark.db_integration
 
-def test_anatomy_methods():
+
+def test_anatomy_methods(db):
     """Test anatomy search convenience methods."""
-    db = DatabaseMethods()
-
-    # Test C. elegans anatomy
-    results = db.search_anatomy_terms("linker", "WB", limit=3)
-    assert len(results) > 0, "Should find WB anatomy terms for 'linker'"
-    for r in results:
-        assert r.curie is not None
-        assert r.name is not None
-        assert r.ontology_type is not None
-
-    # Test Drosophila anatomy
-    results = db.search_anatomy_terms("wing", "FB", limit=3)
-    assert len(results) > 0, "Should find FB anatomy terms for 'wing'"
-    for r in results:
-        assert r.curie is not None
-        assert r.name is not None
-        assert r.ontology_type is not None
-
-    # Test Zebrafish anatomy
-    results = db.search_anatomy_terms("somite", "ZFIN", limit=3)
-    assert len(results) > 0, "Should find ZFIN anatomy terms for 'somite'"
-    for r in results:
-        assert r.curie is not None
-        assert r.name is not None
-        assert r.ontology_type is not None
-
-
-def test_life_stage_methods():
+    # C. elegans, Drosophila and Zebrafish anatomy searches are independent, so run them concurrently
+    cases = [("linker", "WB"), ("wing", "FB"), ("somite", "ZFIN")]
+    with ThreadPoolExecutor(max_workers=len(cases)) as executor:
+        futures = {case: executor.submit(db.search_anatomy_terms, *case, limit=3) for case in cases}
+
+    for (term, org), future in futures.items():
+        results = future.result()
+        assert len(results) > 0, f"Should find {org} anatomy terms for '{term}'"
+        assert_ontology_results(results)
+
+
+def test_life_stage_methods(db):
     """Test life stage search convenience methods."""
-    db = DatabaseMethods()
-
-    # Test C. elegans life stages
-    results = db.search_life_stage_terms("L3", "WB", limit=3)
-    assert len(results) > 0, "Should find WB life stage terms for 'L3'"
-    for r in results:
-        assert r.curie is not None
-        assert r.name is not None
-        assert r.ontology_type is not None
-
-    # Test Drosophila life stages
-    results = db.search_life_stage_terms("larval", "FB", limit=3)
-    assert len(results) > 0, "Should find FB life stage terms for 'larval'"
-    for r in results:
-        assert r.curie is not None
-        assert r.name is not None
-        assert r.ontology_type is not None
-
-    # Test Zebrafish life stages
-    results = db.search_life_stage_terms("adult", "ZFIN", limit=3)
-    assert len(results) > 0, "Should find ZFIN life stage terms for 'adult'"
-    for r in results:
-        assert r.curie is not None
-        assert r.name is not None
-        assert r.ontology_type is not None
-
-
-def test_go_methods():
+    # C. elegans, Drosophila and Zebrafish life stages
+    cases = [("L3", "WB"), ("larval", "FB"), ("adult", "ZFIN")]
+    with ThreadPoolExecutor(max_workers=len(cases)) as executor:
+        futures = {case: executor.submit(db.search_life_stage_terms, *case, limit=3) for case in cases}
+
+    for (term, org), future in futures.items():
+        results = future.result()
+        assert len(results) > 0, f"Should find {org} life stage terms for '{term}'"
+        assert_ontology_results(results)
+
+
+def test_go_methods(db):
     """Test GO term search convenience methods."""
-    db = DatabaseMethods()
-
-    # Test cellular component search
-    results = db.search_go_terms("nucleus", go_aspect="cellular_component", limit=3)
-    assert len(results) > 0, "Should find GO cellular component terms for 'nucleus'"
-    for r in results:
-        assert r.curie is not None
-        assert r.name is not None
-        assert r.ontology_type is not None
-
-    # Test biological process search
-    results = db.search_go_terms("apoptosis", go_aspect="biological_process", limit=3)
-    assert len(results) > 0, "Should find GO biological process terms for 'apoptosis'"
-    for r in results:
-        assert r.curie is not None
-        assert r.name is not None
-        assert r.ontology_type is not None
-
-    # Test molecular function search
-    results = db.search_go_terms("kinase", go_aspect="molecular_function", limit=3)
-    assert len(results) > 0, "Should find GO molecular function terms for 'kinase'"
-    for r in results:
-        assert r.curie is not None
-        assert r.name is not None
-        assert r.ontology_type is not None
-
-    # Test all GO aspects (no filtering)
-    results = db.search_go_terms("cell", go_aspect=None, limit=5)
-    assert len(results) > 0, "Should find GO terms for 'cell'"
-    for r in results:
-        assert r.curie is not None
-        assert r.name is not None
-        assert r.ontology_type is not None
-
-
-def test_organism_switching():
+    # One search per GO aspect, plus one across all aspects (no filtering)
+    cases = [
+        ("nucleus", "cellular_component", 3),
+        ("apoptosis", "biological_process", 3),
+        ("kinase", "molecular_function", 3),
+        ("cell", None, 5),
+    ]
+    with ThreadPoolExecutor(max_workers=len(cases)) as executor:
+        futures = {
+            case: executor.submit(db.search_go_terms, case[0], go_aspect=case[1], limit=case[2]) for case in cases
+        }
+
+    for (term, aspect, _), future in futures.items():
+        results = future.result()
+        assert len(results) > 0, f"Should find GO {aspect or 'any aspect'} terms for '{term}'"
+        assert_ontology_results(results)
+
+
+def test_organism_switching(db):
     """Test organism switching with same search term."""
-    db = DatabaseMethods()
-
     search_term = "brain"
 
-    # C. elegans
-    wb_results = db.search_anatomy_terms(search_term, "WB", limit=2)
-    for r in wb_results:
-        assert r.curie is not None
-        assert r.name is not None
-
-    # Drosophila
-    fb_results = db.search_anatomy_terms(search_term, "FB", limit=2)
-    for r in fb_results:
-        assert r.curie is not None
-        assert r.name is not None
-
-    # Zebrafish
-    zfin_results = db.search_anatomy_terms(search_term, "ZFIN", limit=2)
-    for r in zfin_results:
-        assert r.curie is not None
-        assert r.name is not None
-
-    # Mouse
-    mgi_results = db.search_anatomy_terms(search_term, "MGI", limit=2)
-    for r in mgi_results:
-        assert r.curie is not None
-        assert r.name is not None
-
-
-if __name__ == "__main__":
-    import sys
-
-    try:
-        test_anatomy_methods()
-        test_life_stage_methods()
-        test_go_methods()
-        test_organism_switching()
-        print("All tests passed!")
-    except Exception:
-        import traceback
-
-        traceback.print_exc()
-        sys.exit(1)
+    # C. elegans, Drosophila, Zebrafish and Mouse
+    organisms = ("WB", "FB", "ZFIN", "MGI")
+    with ThreadPoolExecutor(max_workers=len(organisms)) as executor:
+        futures = [executor.submit(db.search_anatomy_terms, search_term, org, limit=2) for org in organisms]
+
+    for future in futures:
+        assert_ontology_results(future.result())
@@ -7,24 +7,18 @@ against production database.
 """
 
 import pytest
-import os
 
-from agr_curation_api.db_methods import DatabaseMethods
 from agr_curation_api.models import DiseaseAnnotation
 
-pytestmark = pytest.mark.skipif(
-    not os.getenv("PERSISTENT_STORE_DB_HOST"),
-    reason="Database integration tests require PERSISTENT_STORE_DB_* environment variables",
-)
+# Skipped at collection time (see conftest.py) unless database credentials are available
+pytestmark = pytest.mark.db_integration
 
 
 class TestGeneDiseaseAnnotations:
     """Tests for gene disease annotation queries."""
 
-    def test_get_disease_annotations_by_gene_wormbase(self):
+    def test_get_disease_annotations_by_gene_wormbase(self, db):
         """Test getting disease annotations for a specific C. elegans gene."""
-        db = DatabaseMethods()
-
         # Test with a known gene that has disease annotations (rab-7)
         results = db.get_disease_annotations_by_gene("WB:WBGene00004271")
 
@@ -39,10 +33,8 @@ class TestGeneDiseaseAnnotations:
             assert ann.relation is not None
             assert ann.data_provider == "WB"
 
-    def test_get_disease_annotations_by_gene_with_evidence_codes(self):
+    def test_get_disease_annotations_by_gene_with_evidence_codes(self, db):
         """Test that evidence codes are retrieved when requested."""
-        db = DatabaseMethods()
-
         results = db.get_disease_annotations_by_gene(
             "WB:WBGene00004271", include_evidence_codes=True
         )
@@ -58,10 +50,8 @@ class TestGeneDiseaseAnnotations:
                 for code in ann.evidence_codes:
                     assert code.startswith("ECO:"), f"Evidence code should be ECO term: {code}"
 
-    def test_get_disease_annotations_by_gene_rat(self):
+    def test_get_disease_annotations_by_gene_rat(self, db):
         """Test getting disease annotations for a rat gene."""
-        db = DatabaseMethods()
-
         # RGD gene with known disease annotations
         results = db.get_disease_annotations_by_gene("RGD:1303073")
 
@@ -72,10 +62,8 @@ class TestGeneDiseaseAnnotations:
             assert ann.disease_curie is not None
             assert ann.data_provider == "RGD"
 
-    def test_get_disease_annotations_by_gene_not_found(self):
+    def test_get_disease_annotations_by_gene_not_found(self, db):
         """Test getting disease annotations for a gene with none."""
-        db = DatabaseMethods()
-
         results = db.get_disease_annotations_by_gene("WB:WBGene99999999")
         assert len(results) == 0, "Should return empty list for non-existent gene"
 
@@ -83,10 +71,8 @@ class TestGeneDiseaseAnnotations:
 class TestTaxonDiseaseAnnotations:
     """Tests for taxon-based disease annotation queries."""
 
-    def test_get_gene_disease_annotations_by_taxon_worm(self):
+    def test_get_gene_disease_annotations_by_taxon_worm(self, db):
         """Test getting gene disease annotations for C. elegans."""
-        db = DatabaseMethods()
-
         results = db.get_disease_annotations_by_taxon(
             "NCBITaxon:6239", annotation_type="gene", limit=10
         )
@@ -101,15 +87,13 @@ class TestTaxonDiseaseAnnotations:
             assert ann.disease_curie is not None
             assert ann.disease_name is not None
 
-    def test_get_gene_disease_annotations_by_taxon_rat(self):
+    def test_get_gene_disease_annotations_by_taxon_rat(self, db):
         """Test getting gene disease annotations for rat.
 
         Note: Mouse (NCBITaxon:10090) does not have gene disease annotations -
         MGI submits allele and AGM disease annotations instead.
         Rat (NCBITaxon:10116) has gene disease annotations from RGD.
         """
-        db = DatabaseMethods()
-
         results = db.get_disease_annotations_by_taxon(
             "NCBITaxon:10116", annotation_type="gene", limit=10
         )
@@ -119,10 +103,8 @@ class TestTaxonDiseaseAnnotations:
             assert ann.subject_type == "gene"
             assert ann.subject_taxon == "NCBITaxon:10116"
 
-    def test_get_allele_disease_annotations_by_taxon(self):
+    def test_get_allele_disease_annotations_by_taxon(self, db):
         """Test getting allele disease annotations for mouse."""
-        db = DatabaseMethods()
-
         results = db.get_disease_annotations_by_taxon(
             "NCBITaxon:10090", annotation_type="allele", limit=10
         )
@@ -136,10 +118,8 @@ class TestTaxonDiseaseAnnotations:
             # Allele annotations may have inferred gene
             # (not required, but field should exist)
 
-    def test_get_agm_disease_annotations_by_taxon(self):
+    def test_get_agm_disease_annotations_by_taxon(self, db):
         """Test getting AGM disease annotations for zebrafish."""
-        db = DatabaseMethods()
-
         results = db.get_disease_annotations_by_taxon(
             "NCBITaxon:7955", annotation_type="agm", limit=10
         )
@@ -152,10 +132,8 @@ class TestTaxonDiseaseAnnotations:
             assert ann.subject_id is not None
             assert ann.subject_id.startswith("ZFIN:")
 
-    def test_pagination(self):
+    def test_pagination(self, db):
         """Test that pagination works correctly."""
-        db = DatabaseMethods()
-
         # Get first page
         page1 = db.get_disease_annotations_by_taxon(
             "NCBITaxon:6239", annotation_type="gene", limit=5, offset=0
@@ -178,10 +156,8 @@ class TestTaxonDiseaseAnnotations:
 class TestRawDiseaseAnnotations:
     """Tests for raw dictionary disease annotation queries."""
 
-    def test_get_disease_annotations_raw(self):
+    def test_get_disease_annotations_raw(self, db):
         """Test getting disease annotations as raw dictionaries."""
-        db = DatabaseMethods()
-
         results = db.get_disease_annotations_raw(
             "NCBITaxon:6239", annotation_type="gene", limit=5
         )
@@ -197,10 +173,8 @@ class TestRawDiseaseAnnotations:
             assert "relation" in r
             assert r["subject_type"] == "gene"
 
-    def test_raw_vs_model_consistency(self):
+    def test_raw_vs_model_consistency(self, db):
         """Test that raw and model results return consistent data."""
-        db = DatabaseMethods()
-
         raw_results = db.get_disease_annotations_raw(
             "NCBITaxon:6239", annotation_type="gene", limit=3
         )
@@ -219,10 +193,8 @@ class TestRawDiseaseAnnotations:
 class TestDiseaseQueries:
     """Tests for disease-based queries."""
 
-    def test_get_annotations_by_disease(self):
+    def test_get_annotations_by_disease(self, db):
         """Test getting annotations for a specific disease."""
-        db = DatabaseMethods()
-
         # DOID:9970 is obesity - should have multiple annotations
         results = db.get_disease_annotations_by_disease("DOID:9970", limit=10)
 
@@ -231,10 +203,8 @@ class TestDiseaseQueries:
             assert isinstance(ann, DiseaseAnnotation)
             assert ann.disease_curie == "DOID:9970"
 
-    def test_get_annotations_by_disease_type_filter(self):
+    def test_get_annotations_by_disease_type_filter(self, db):
         """Test filtering disease annotations by type."""
-        db = DatabaseMethods()
-
         # Get only gene annotations for a disease
         gene_results = db.get_disease_annotations_by_disease(
             "DOID:9970", annotation_type="gene", limit=10
@@ -248,10 +218,8 @@ class TestDiseaseQueries:
 class TestDataProviders:
     """Tests for different data providers."""
 
-    def test_wormbase_annotations(self):
+    def test_wormbase_annotations(self, db):
         """Test WormBase disease annotations."""
-        db = DatabaseMethods()
-
         results = db.get_disease_annotations_by_taxon(
             "NCBITaxon:6239", annotation_type="gene", limit=5
         )
@@ -259,13 +227,11 @@ class TestDataProviders:
         wb_annotations = [r for r in results if r.data_provider == "WB"]
         assert len(wb_annotations) > 0, "Should find WormBase disease annotations"
 
-    def test_flybase_annotations(self):
+    def test_flybase_annotations(self, db):
         """Test FlyBase disease annotations.
 
         Note: FlyBase submits disease annotations at the AGM level, not gene level.
         """
-        db = DatabaseMethods()
-
         results = db.get_disease_annotations_by_taxon(
             "NCBITaxon:7227", annotation_type="agm", limit=10
         )
@@ -273,13 +239,11 @@ class TestDataProviders:
         fb_annotations = [r for r in results if r.data_provider == "FB"]
         assert len(fb_annotations) > 0, "Should find FlyBase AGM disease annotations"
 
-    def test_mgi_annotations(self):
+    def test_mgi_annotations(self, db):
         """Test MGI disease annotations.
 
         Note: MGI submits disease annotations at the allele and AGM levels, not gene level.
         """
-        db = DatabaseMethods()
-
         results = db.get_disease_annotations_by_taxon(
             "NCBITaxon:10090", annotation_type="allele", limit=10
         )
@@ -287,56 +251,11 @@ class TestDataProviders:
         mgi_annotations = [r for r in results if r.data_provider == "MGI"]
         assert len(mgi_annotations) > 0, "Should find MGI allele disease annotations"
 
-    def test_rgd_annotations(self):
+    def test_rgd_annotations(self, db):
         """Test RGD disease annotations."""
-        db = DatabaseMethods()
-
         results = db.get_disease_annotations_by_taxon(
             "NCBITaxon:10116", annotation_type="gene", limit=10
         )
 
         rgd_annotations = [r for r in results if r.data_provider == "RGD"]
         assert len(rgd_annotations) > 0, "Should find RGD disease annotations"
-
-
-if __name__ == "__main__":
-    import sys
-
-    # Allow running tests directly
-    try:
-        db = DatabaseMethods()
-
-        print("Testing gene disease annotations...")
-        test_instance = TestGeneDiseaseAnnotations()
-        test_instance.test_get_disease_annotations_by_gene_wormbase()
-        test_instance.test_get_disease_annotations_by_gene_with_evidence_codes()
-        test_instance.test_get_disease_annotations_by_gene_rat()
-        print("  Gene tests passed!")
-
-        print("Testing taxon disease annotations...")
-        taxon_tests = TestTaxonDiseaseAnnotations()
-        taxon_tests.test_get_gene_disease_annotations_by_taxon_worm()
-        taxon_tests.test_get_gene_disease_annotations_by_taxon_rat()
-        taxon_tests.test_get_allele_disease_annotations_by_taxon()
-        taxon_tests.test_get_agm_disease_annotations_by_taxon()
-        taxon_tests.test_pagination()
-        print("  Taxon tests passed!")
-
-        print("Testing raw disease annotations...")
-        raw_tests = TestRawDiseaseAnnotations()
-        raw_tests.test_get_disease_annotations_raw()
-        raw_tests.test_raw_vs_model_consistency()
-        print("  Raw tests passed!")
-
-        print("Testing disease queries...")
-        disease_tests = TestDiseaseQueries()
-        disease_tests.test_get_annotations_by_disease()
-        print("  Disease query tests passed!")
-
-        print("\nAll tests passed!")
-
-    except Exception:
-        import traceback
-
-        traceback.print_exc()
-        sys.exit(1)
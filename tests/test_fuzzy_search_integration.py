@@ -12,19 +12,15 @@ The tests verify:
 """
 
 import pytest
-import os
-from agr_curation_api.db_methods import DatabaseMethods, DatabaseConfig
+
+# Skipped at collection time (see conftest.py) unless database credentials are available
+pytestmark = pytest.mark.db_integration
 
 
 @pytest.fixture(scope="module")
-def db_methods():
-    """Create DatabaseMethods instance connected to real database."""
-    # Check if we're running in CI with database tunnel
-    if not os.getenv("PERSISTENT_STORE_DB_HOST"):
-        pytest.skip("Database integration tests require PERSISTENT_STORE_DB_* environment variables")
-
-    config = DatabaseConfig()
-    return DatabaseMethods(config)
+def db_methods(db):
+    """DatabaseMethods instance connected to the real database (shared session fixture)."""
+    return db
 
 
 class TestTieredSearchIntegration:
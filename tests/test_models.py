@@ -1,226 +1,341 @@
 #!/usr/bin/env python
 """Unit tests for AGR Curation API models that match actual API responses."""
 
-import unittest
-from datetime import datetime
-from typing import Set
+import json
+import subprocess
 import sys
-import os
-import importlib.util
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
-# Direct import of models module, bypassing __init__.py to avoid okta initialization issues
-models_path = os.path.join(os.path.dirname(__file__), "..", "src", "agr_curation_api", "models.py")
-spec = importlib.util.spec_from_file_location("models", models_path)
-models = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(models)
-
-
-class TestModelFieldAlignment(unittest.TestCase):
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from agr_curation_api import models, nested_models
+
+# Fixed timestamp for audit fields so sample models are deterministic
+_FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Nested payloads shared by the instantiation and serialization tests.
+# Models validate these into new objects, so sharing the dicts is safe.
+_PROTEIN_CODING_GENE = {"curie": "SO:0001217", "name": "protein_coding_gene"}
+_MOUSE_TAXON = {"curie": "NCBITaxon:10090", "name": "Mus musculus"}
+
+# Fields each model must expose to match the API responses
+_GENE_FIELDS = frozenset(
+    {
+        # Core gene fields (API format)
+        "curie",
+        "primaryExternalId",
+        "geneSymbol",
+        "geneFullName",
+        "geneSystematicName",
+        "geneSynonyms",
+        "geneSecondaryIds",
+        "geneType",
+        "dataProvider",
+        "taxon",
+        "obsolete",
+        # API metadata fields
+        "type",
+        "id",
+        "internal",
+        # Audit fields
+        "createdBy",
+        "updatedBy",
+        "dateCreated",
+        "dateUpdated",
+        # Cross references
+        "crossReferences",
+    }
+)
+
+_SPECIES_FIELDS = frozenset(
+    {
+        # Core species fields (API format)
+        "curie",
+        "name",
+        "displayName",
+        "abbreviation",
+        "commonNames",
+        "genomeAssembly",
+        "phylogeneticOrder",
+        "taxon",
+        "obsolete",
+        "internal",
+        # API metadata fields
+        "type",
+        "id",
+    }
+)
+
+_ONTOLOGY_TERM_FIELDS = frozenset(
+    {
+        "curie",
+        "name",
+        "definition",
+        "namespace",
+        "obsolete",
+        "childCount",
+        "descendantCount",
+        "ancestors",
+        # API metadata fields
+        "type",
+        "id",
+        "internal",
+    }
+)
+
+_ALLELE_FIELDS = frozenset(
+    {
+        # Core allele fields (API format)
+        "curie",
+        "primaryExternalId",
+        "alleleSymbol",
+        "alleleFullName",
+        "alleleSynonyms",
+        "references",
+        "laboratoryOfOrigin",
+        "isExtinct",
+        "isExtrachromosomal",
+        "isIntegrated",
+        "dataProvider",
+        "taxon",
+        "obsolete",
+        "internal",
+        # API metadata fields
+        "type",
+        "id",
+        # Audit fields
+        "createdBy",
+        "updatedBy",
+        "dateCreated",
+        "dateUpdated",
+        # Cross references
+        "crossReferences",
+    }
+)
+
+_EXPRESSION_ANNOTATION_FIELDS = frozenset(
+    {
+        "curie",
+        "expressionAnnotationSubject",
+        "expressionPattern",
+        "whenExpressedStageName",
+        "whereExpressedStatement",
+    }
+)
+
+
+_AUDIT_FIELDS = frozenset({"created_by", "date_created", "updated_by", "date_updated"})
+
+# (model class, expected fields) table driving the field-alignment test
+_FIELD_SPECS = (
+    pytest.param(nested_models.SlotAnnotation, _AUDIT_FIELDS, id="SlotAnnotation"),
+    pytest.param(models.Gene, _GENE_FIELDS, id="Gene"),
+    pytest.param(models.Species, _SPECIES_FIELDS, id="Species"),
+    pytest.param(models.OntologyTerm, _ONTOLOGY_TERM_FIELDS, id="OntologyTerm"),
+    pytest.param(models.Allele, _ALLELE_FIELDS, id="Allele"),
+    pytest.param(models.ExpressionAnnotation, _EXPRESSION_ANNOTATION_FIELDS, id="ExpressionAnnotation"),
+)
+
+
+@pytest.mark.parametrize("model_class,expected_fields", _FIELD_SPECS)
+def test_model_fields_present(model_class, expected_fields):
     """Test that models have expected fields that match API responses."""
-
-    def assertFieldsPresent(self, model_class, expected_fields: Set[str], model_name: str):
-        """Helper to assert that expected fields are present in model."""
-        actual_fields = set(model_class.model_fields.keys())
-        missing_fields = expected_fields - actual_fields
-
-        self.assertEqual(missing_fields, set(), f"{model_name} missing fields: {missing_fields}")
-
-    def test_gene_model_fields(self):
-        """Test Gene model has all required API fields."""
-        expected_fields = {
-            # Core gene fields (API format)
-            "curie",
-            "primaryExternalId",
-            "geneSymbol",
-            "geneFullName",
-            "geneSystematicName",
-            "geneSynonyms",
-            "geneSecondaryIds",
-            "geneType",
-            "dataProvider",
-            "taxon",
-            "obsolete",
-            # API metadata fields
-            "type",
-            "id",
-            "internal",
-            # Audit fields
-            "createdBy",
-            "updatedBy",
-            "dateCreated",
-            "dateUpdated",
-            # Cross references
-            "crossReferences",
-        }
-        self.assertFieldsPresent(models.Gene, expected_fields, "Gene")
-
-    def test_species_model_fields(self):
-        """Test Species model has required API fields."""
-        expected_fields = {
-            # Core species fields (API format)
-            "curie",
-            "name",
-            "displayName",
-            "abbreviation",
-            "commonNames",
-            "genomeAssembly",
-            "phylogeneticOrder",
-            "taxon",
-            "obsolete",
-            "internal",
-            # API metadata fields
-            "type",
-            "id",
-        }
-        self.assertFieldsPresent(models.Species, expected_fields, "Species")
-
-    def test_ontology_term_fields(self):
-        """Test OntologyTerm model has API fields."""
-        expected_fields = {
-            "curie",
-            "name",
-            "definition",
-            "namespace",
-            "obsolete",
-            "childCount",
-            "descendantCount",
-            "ancestors",
-            # API metadata fields
-            "type",
-            "id",
-            "internal",
-        }
-        self.assertFieldsPresent(models.OntologyTerm, expected_fields, "OntologyTerm")
-
-    def test_allele_model_fields(self):
-        """Test Allele model has API fields."""
-        expected_fields = {
-            # Core allele fields (API format)
-            "curie",
-            "primaryExternalId",
-            "alleleSymbol",
-            "alleleFullName",
-            "alleleSynonyms",
-            "references",
-            "laboratoryOfOrigin",
-            "isExtinct",
-            "isExtrachromosomal",
-            "isIntegrated",
-            "dataProvider",
-            "taxon",
-            "obsolete",
-            "internal",
-            # API metadata fields
-            "type",
-            "id",
-            # Audit fields
-            "createdBy",
-            "updatedBy",
-            "dateCreated",
-            "dateUpdated",
-            # Cross references
-            "crossReferences",
-        }
-        self.assertFieldsPresent(models.Allele, expected_fields, "Allele")
-
-    def test_expression_annotation_fields(self):
-        """Test ExpressionAnnotation model has API fields."""
-        expected_fields = {
-            "curie",
-            "expressionAnnotationSubject",
-            "expressionPattern",
-            "whenExpressedStageName",
-            "whereExpressedStatement",
-        }
-        self.assertFieldsPresent(models.ExpressionAnnotation, expected_fields, "ExpressionAnnotation")
-
-
-class TestModelInstantiation(unittest.TestCase):
+    actual_fields = model_class.model_fields.keys()
+
+    assert actual_fields >= expected_fields, f"{model_class.__name__} missing fields: {expected_fields - actual_fields}"
+
+
+@pytest.fixture(scope="module")
+def sample_gene():
+    """Gene shared by the instantiation and serialization tests."""
+    return models.Gene(
+        curie="MGI:12345",
+        primaryExternalId="MGI:12345",
+        geneSymbol={"displayText": "Abc1", "internal": False},
+        geneFullName={"displayText": "ABC transporter 1"},
+        geneType=_PROTEIN_CODING_GENE,
+        geneSecondaryIds=["ENSEMBL:ENSMUSG00000001"],
+        taxon=_MOUSE_TAXON,
+        createdBy="curator1",
+        dateCreated=_FROZEN_NOW,
+        obsolete=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_species():
+    """Species shared by the instantiation and serialization tests."""
+    return models.Species(
+        curie="NCBITaxon:10090",
+        displayName="Mus musculus",
+        genomeAssembly="GRCm39",
+        taxon=_MOUSE_TAXON,
+        obsolete=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_allele():
+    """Allele shared by the instantiation and serialization tests."""
+    return models.Allele(
+        curie="MGI:3000001",
+        alleleSymbol={"displayText": "Abc1<tm1>"},
+        isExtinct=False,
+        isExtrachromosomal=True,
+        obsolete=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_ontology_term():
+    """OntologyTerm shared by the instantiation tests."""
+    return models.OntologyTerm(curie="GO:0008150", name="biological_process", obsolete=False)
+
+
+class TestModelInstantiation:
     """Test that models can be instantiated with valid data."""
 
-    def test_gene_instantiation(self):
+    def test_gene_instantiation(self, sample_gene):
         """Test Gene model can be instantiated."""
-        gene = models.Gene(curie="FB:FBgn0024733", geneSymbol={"displayText": "RpL10"}, obsolete=False)
-        self.assertEqual(gene.curie, "FB:FBgn0024733")
-        self.assertIsNotNone(gene.geneSymbol)
-        self.assertFalse(gene.obsolete)
+        assert sample_gene.curie == "MGI:12345"
+        assert sample_gene.geneSymbol is not None
+        assert sample_gene.obsolete is False
+
+    def test_gene_type_and_taxon_objects(self, sample_gene):
+        """Test geneType and taxon objects parse into term models while strings pass through."""
+        assert isinstance(sample_gene.geneType, models.OntologyTerm)
+        assert sample_gene.geneType.name == "protein_coding_gene"
+        assert isinstance(sample_gene.taxon, models.NCBITaxonTerm)
+        assert sample_gene.taxon.curie == "NCBITaxon:10090"
+
+        allele = models.Allele(curie="MGI:5249690", taxon="NCBITaxon:10090")
+        assert allele.taxon == "NCBITaxon:10090"
+
+    def test_unexpected_term_payloads_fall_back_to_dicts(self):
+        """Test taxon/geneType objects that do not fit the term models do not fail the record."""
+        taxon = {
+            "curie": "NCBITaxon:6239",
+            "name": "Caenorhabditis elegans",
+            "synonyms": [{"name": "C. elegans", "internal": False}],
+        }
 
-    def test_species_instantiation(self):
+        for model_class in (models.Gene, models.Allele, models.Species):
+            record = model_class(curie="TEST:001", taxon=taxon)
+            assert record.taxon == taxon
+
+        gene = models.Gene(curie="WB:WBGene00000001", geneType={"curie": "SO:0001217", "childCount": "many"})
+        assert gene.geneType == {"curie": "SO:0001217", "childCount": "many"}
+
+    def test_api_config_base_url(self):
+        """Test APIConfig reuses parsed base URLs and still rejects invalid ones."""
+        assert models.APIConfig().base_url is models.APIConfig().base_url
+        assert str(models.APIConfig(base_url="https://example.org/api").base_url) == "https://example.org/api"
+        with pytest.raises(ValidationError):
+            models.APIConfig(base_url="not a url")
+
+    def test_api_config_json_timedelta(self):
+        """Test APIConfig serializes timedeltas as seconds in JSON."""
+        config = models.APIConfig(timeout=timedelta(seconds=45))
+        assert json.loads(config.model_dump_json())["timeout"] == 45.0
+        assert config.model_dump()["timeout"] == timedelta(seconds=45)
+
+    def test_api_config_rejects_non_positive_timedelta(self):
+        """Test APIConfig rejects zero or negative timeouts and retry delays."""
+        with pytest.raises(ValidationError):
+            models.APIConfig(timeout=timedelta(0))
+        with pytest.raises(ValidationError):
+            models.APIConfig(retry_delay=timedelta(seconds=-1))
+
+    def test_species_instantiation(self, sample_species):
         """Test Species model can be instantiated."""
-        species = models.Species(curie="NCBITaxon:7227", displayName="Drosophila melanogaster", obsolete=False)
-        self.assertEqual(species.curie, "NCBITaxon:7227")
-        self.assertEqual(species.displayName, "Drosophila melanogaster")
+        assert sample_species.curie == "NCBITaxon:10090"
+        assert sample_species.displayName == "Mus musculus"
 
-    def test_ontology_term_instantiation(self):
+    def test_ontology_term_instantiation(self, sample_ontology_term):
         """Test OntologyTerm model can be instantiated."""
-        term = models.OntologyTerm(curie="GO:0008150", name="biological_process", obsolete=False)
-        self.assertEqual(term.curie, "GO:0008150")
-        self.assertEqual(term.name, "biological_process")
+        assert sample_ontology_term.curie == "GO:0008150"
+        assert sample_ontology_term.name == "biological_process"
+
+    def test_ontology_term_is_frozen(self, sample_ontology_term):
+        """Test OntologyTerm stores ancestors as a tuple and rejects mutation."""
+        term = models.OntologyTerm(curie="GO:0005634", ancestors=["GO:0003674", "GO:0005575"])
+        assert term.ancestors == ("GO:0003674", "GO:0005575")
+        with pytest.raises(ValidationError):
+            sample_ontology_term.name = "nucleus"
+
+    def test_populated_terms_are_hashable(self):
+        """Test populated OntologyTerm and NCBITaxonTerm instances can be hashed."""
+        term = models.OntologyTerm(curie="GO:0005634", name="nucleus", ancestors=["GO:0005575"])
+        taxon = models.NCBITaxonTerm(
+            curie="NCBITaxon:6239",
+            name="Caenorhabditis elegans",
+            synonyms=["C. elegans"],
+            crossReferences=[{"referencedCurie": "WB:6239"}],
+            ancestors=["NCBITaxon:6237"],
+        )
+        assert taxon.synonyms == ("C. elegans",)
+        assert hash(term) == hash(term.model_copy())
+        assert hash(taxon) == hash(taxon.model_copy())
+        assert len({term, taxon, taxon.model_copy()}) == 2
 
-    def test_allele_instantiation(self):
+    def test_allele_instantiation(self, sample_allele):
         """Test Allele model can be instantiated."""
-        allele = models.Allele(curie="MGI:5249690", alleleSymbol={"displayText": "Gt(IST14665F12)Tigm"}, obsolete=False)
-        self.assertEqual(allele.curie, "MGI:5249690")
-        self.assertIsNotNone(allele.alleleSymbol)
+        assert sample_allele.curie == "MGI:3000001"
+        assert sample_allele.alleleSymbol is not None
 
     def test_expression_annotation_instantiation(self):
         """Test ExpressionAnnotation can be instantiated."""
         expr = models.ExpressionAnnotation(curie="TEST:001", whenExpressedStageName="adult")
-        self.assertEqual(expr.curie, "TEST:001")
-        self.assertEqual(expr.whenExpressedStageName, "adult")
+        assert expr.curie == "TEST:001"
+        assert expr.whenExpressedStageName == "adult"
 
 
-class TestModelSerialization(unittest.TestCase):
+class TestModelSerialization:
     """Test model serialization behavior."""
 
-    def test_gene_json_serialization(self):
+    def test_gene_json_serialization(self, sample_gene):
         """Test Gene model JSON serialization uses API field names."""
-        gene = models.Gene(
-            curie="MGI:12345",
-            primaryExternalId="MGI:12345",
-            geneSymbol={"displayText": "Abc1", "internal": False},
-            geneFullName={"displayText": "ABC transporter 1"},
-            geneType={"curie": "SO:0001217", "name": "protein_coding_gene"},
-            geneSecondaryIds=["ENSEMBL:ENSMUSG00000001"],
-            taxon={"curie": "NCBITaxon:10090", "name": "Mus musculus"},
-            createdBy="curator1",
-            dateCreated=datetime.now(),
-            obsolete=False,
-        )
-
-        # Test model_dump uses our field names
-        gene_dict = gene.model_dump(exclude_none=True)
-        self.assertIn("primaryExternalId", gene_dict)
-        self.assertIn("geneSymbol", gene_dict)
-        self.assertIn("geneFullName", gene_dict)
-        self.assertIn("geneSecondaryIds", gene_dict)
-        self.assertIn("createdBy", gene_dict)
-        self.assertIn("dateCreated", gene_dict)
-
-    def test_species_json_serialization(self):
+        # One JSON serialization pass; the decoded dict backs the field-name checks
+        gene_dict = json.loads(sample_gene.model_dump_json(exclude_none=True))
+        assert "primaryExternalId" in gene_dict
+        assert "geneSymbol" in gene_dict
+        assert "geneFullName" in gene_dict
+        assert "geneSecondaryIds" in gene_dict
+        assert "createdBy" in gene_dict
+        assert gene_dict["dateCreated"] == "2024-01-01T12:00:00"
+
+    def test_species_json_serialization(self, sample_species):
         """Test Species model JSON serialization."""
-        species = models.Species(taxon={"curie": "NCBITaxon:10090"}, displayName="MOUSE", genomeAssembly="GRCm39")
+        species_dict = sample_species.model_dump(exclude_none=True)
+        assert "displayName" in species_dict
+        assert "genomeAssembly" in species_dict
 
-        species_dict = species.model_dump(exclude_none=True)
-        self.assertIn("displayName", species_dict)
-        self.assertIn("genomeAssembly", species_dict)
-
-    def test_allele_with_associations(self):
+    def test_allele_with_associations(self, sample_allele):
         """Test Allele model handles complex data."""
+        allele_dict = sample_allele.model_dump(exclude_none=True)
+        assert "alleleSymbol" in allele_dict
+        assert "isExtinct" in allele_dict
+        assert "isExtrachromosomal" in allele_dict
+
+    def test_allele_references(self):
+        """Test Allele references parse into Reference models and keep CURIEs and reference IDs."""
         allele = models.Allele(
-            curie="MGI:3000001", alleleSymbol={"displayText": "Abc1<tm1>"}, isExtinct=False, isExtrachromosomal=True
+            curie="WB:WBVar00000001",
+            references=[
+                {"curie": "AGRKB:101000000000001", "crossReferences": [{"referencedCurie": "PMID:12345"}]},
+                "AGRKB:101000000000002",
+                42,
+            ],
         )
 
-        allele_dict = allele.model_dump(exclude_none=True)
-        self.assertIn("alleleSymbol", allele_dict)
-        self.assertIn("isExtinct", allele_dict)
-        self.assertIn("isExtrachromosomal", allele_dict)
+        assert isinstance(allele.references[0], models.Reference)
+        assert allele.references[0].crossReferences[0].referencedCurie == "PMID:12345"
+        assert allele.references[1] == "AGRKB:101000000000002"
+        assert allele.references[2] == 42
 
 
-class TestFieldInheritance(unittest.TestCase):
+class TestFieldInheritance:
     """Test that models have proper field inheritance."""
 
     def test_gene_inherits_audit_fields(self):
@@ -230,7 +345,7 @@ class TestFieldInheritance(unittest.TestCase):
 
         # Check that audit fields are present
         for field in audit_fields:
-            self.assertIn(field, gene_fields, f"Gene missing audit field: {field}")
+            assert field in gene_fields, f"Gene missing audit field: {field}"
 
     def test_allele_inherits_audit_fields(self):
         """Test Allele model has audit fields."""
@@ -238,7 +353,7 @@ class TestFieldInheritance(unittest.TestCase):
         audit_fields = {"createdBy", "dateCreated", "updatedBy", "dateUpdated"}
 
         for field in audit_fields:
-            self.assertIn(field, allele_fields, f"Allele missing audit field: {field}")
+            assert field in allele_fields, f"Allele missing audit field: {field}"
 
     def test_species_inherits_audit_fields(self):
         """Test Species model can have audit fields if present in API."""
@@ -248,10 +363,10 @@ class TestFieldInheritance(unittest.TestCase):
         core_fields = {"type", "id", "curie", "obsolete", "internal"}
 
         for field in core_fields:
-            self.assertIn(field, species_fields, f"Species missing core field: {field}")
+            assert field in species_fields, f"Species missing core field: {field}"
 
 
-class TestModelFlexibility(unittest.TestCase):
+class TestModelFlexibility:
     """Test that models handle API response variations gracefully."""
 
     def test_gene_handles_missing_curie(self):
@@ -260,14 +375,14 @@ class TestModelFlexibility(unittest.TestCase):
 
         gene = models.Gene(**gene_data)
         # The model validator should set curie from primaryExternalId
-        self.assertEqual(gene.curie, "FB:FBgn0024733")
+        assert gene.curie == "FB:FBgn0024733"
 
     def test_allele_handles_missing_curie(self):
         """Test Allele model handles missing curie."""
         allele_data = {"primaryExternalId": "MGI:123", "alleleSymbol": {"displayText": "test"}, "obsolete": False}
 
         allele = models.Allele(**allele_data)
-        self.assertEqual(allele.curie, "MGI:123")
+        assert allele.curie == "MGI:123"
 
     def test_models_handle_extra_fields(self):
         """Test models accept extra fields from API."""
@@ -282,8 +397,73 @@ class TestModelFlexibility(unittest.TestCase):
 
         # Should not raise an error due to ConfigDict(extra='allow')
         gene = models.Gene(**gene_data)
-        self.assertEqual(gene.curie, "TEST:001")
+        assert gene.curie == "TEST:001"
+
+    def test_disease_annotation_keeps_extra_fields(self):
+        """Test DiseaseAnnotation keeps keys it does not declare."""
+        annotation = models.DiseaseAnnotation(curie="AGRKB:100000000000001", evidence_code_names=["IMP"])
+        assert annotation.model_extra == {"evidence_code_names": ["IMP"]}
+
+
+class TestAPIResponse:
+    """Test parsing of the generic API response envelope."""
+
+    def test_parse_response(self):
+        """Test APIResponse parses raw JSON bytes using the API aliases."""
+        raw = b'{"totalResults": 2, "returnedRecords": 1, "results": [{"curie": "WB:WBGene00000001"}]}'
 
+        response = models.APIResponse.parse_response(raw)
+        assert response.total_results == 2
+        assert response.returned_records == 1
+        assert response.results == [{"curie": "WB:WBGene00000001"}]
 
-if __name__ == "__main__":
-    unittest.main()
+    def test_field_names(self):
+        """Test APIResponse accepts field names as well as API aliases and drops unknown keys."""
+        response = models.APIResponse(total_results=5, returned_records=5, debug="ignored")
+        assert response.total_results == 5
+        assert "debug" not in response.model_dump()
+
+
+class TestOntologyTermResult:
+    """Test the ontology search result model."""
+
+    def test_ignores_extra_fields(self):
+        """Test database result models drop keys they do not declare."""
+        term = models.OntologyTermResult(
+            curie="WBbt:0005062", name="linker cell", namespace="", ontology_type="WBBTTerm", rank=1
+        )
+        assert term.model_extra is None
+        assert "rank" not in term.model_dump()
+
+    def test_name_lower(self):
+        """Test name_lower is the lower-cased name and is not serialized."""
+        result = models.OntologyTermResult(
+            curie="WBbt:0005062", name="Linker Cell", namespace="anatomy", ontology_type="WBBTTerm"
+        )
+        assert result.name_lower == "linker cell"
+        assert result.model_copy(update={"name": "Gonad"}).name_lower == "gonad"
+        assert "name_lower" not in result.model_dump()
+
+    def test_is_frozen(self):
+        """Test search results are immutable and hashable, since cached results are shared."""
+        result = models.OntologyTermResult(
+            curie="WBbt:0005062",
+            name="linker cell",
+            namespace="anatomy",
+            ontology_type="WBBTTerm",
+            synonyms=["linker"],
+        )
+        assert result.synonyms == ("linker",)
+        assert hash(result) == hash(result.model_copy())
+        with pytest.raises(ValidationError):
+            result.name = "changed"
+
+
+def test_package_import_is_lazy():
+    """Test importing the package does not load the client or database modules."""
+    code = (
+        "import sys, agr_curation_api; "
+        "print('agr_curation_api.client' in sys.modules, 'agr_curation_api.db_methods' in sys.modules)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.split() == ["False", "False"]
@@ -1,5 +1,7 @@
 """Tests for nested Pydantic models."""
 
+from datetime import datetime, timezone
+
 import pytest
 from pydantic import ValidationError
 
@@ -40,6 +42,39 @@ class TestGeneSymbolSlotAnnotation:
         assert symbol.display_text == "Pax6"
         assert symbol.created_by == "user123"
 
+    def test_audit_person_objects(self):
+        """Test that person objects in audit fields are reduced to user IDs."""
+        data = {
+            "displayText": "Pax6",
+            "formatText": "Pax6",
+            "createdBy": {"id": 42, "uniqueId": "curator@example.org"},
+            "updatedBy": {"id": 7},
+        }
+
+        symbol = GeneSymbolSlotAnnotation(**data)
+        assert symbol.created_by == "curator@example.org"
+        assert symbol.updated_by == "7"
+
+    def test_audit_person_object_without_identifier(self):
+        """Test that a person object with no uniqueId or id gives no user ID."""
+        data = {"displayText": "Pax6", "formatText": "Pax6", "createdBy": {"firstName": "Ada"}}
+
+        symbol = GeneSymbolSlotAnnotation(**data)
+        assert symbol.created_by is None
+
+    def test_audit_dates(self):
+        """Test that audit timestamps parse to timezone-aware datetimes."""
+        data = {
+            "displayText": "Pax6",
+            "formatText": "Pax6",
+            "dateCreated": "2024-01-15T10:30:00Z",
+            "dateUpdated": "2024-01-16T08:00:00.123+01:00",
+        }
+
+        symbol = GeneSymbolSlotAnnotation(**data)
+        assert symbol.date_created == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        assert symbol.date_updated == datetime(2024, 1, 16, 7, 0, 0, 123000, tzinfo=timezone.utc)
+
     def test_required_fields(self):
         """Test that required fields are enforced."""
         with pytest.raises(ValidationError):
@@ -2,125 +2,119 @@
 """Parameterized tests for all ontology types.
 
 This module consolidates testing for all 45 ontology types using pytest parameterization,
-replacing the need for 45 separate test files.
+replacing the need for 45 separate test files. It checks that every type in the production
+database can be searched with search_ontology_terms() and exercises the search modes per type.
 """
 
 import pytest
-import os
-from agr_curation_api.db_methods import DatabaseMethods
+
 from agr_curation_api.models import OntologyTermResult
 
+from tests._db_singleton import assert_ontology_results, cached_search
 
-# Skip all tests if database credentials not available
-pytestmark = pytest.mark.skipif(
-    not os.getenv("PERSISTENT_STORE_DB_HOST"),
-    reason="Database integration tests require PERSISTENT_STORE_DB_* environment variables",
-)
+# Skipped at collection time (see conftest.py) unless database credentials are available
+pytestmark = pytest.mark.db_integration
 
 
-# All 45 ontology types with test terms specific to each
+# All 45 ontology types found in production database, with test terms specific to each
+# (from query: SELECT DISTINCT ontologytermtype FROM ontologyterm)
 ONTOLOGY_TEST_CASES = [
-    ("APOTerm", ["abnormal", "phenotype", "morphology"]),
-    ("ATPTerm", ["phenotype", "abnormal", "development"]),
-    ("BSPOTerm", ["anterior", "posterior", "proximal"]),
-    ("BTOTerm", ["tissue", "cell", "organ"]),
-    ("CHEBITerm", ["protein", "molecular", "chemical"]),
-    ("CLTerm", ["cell", "neuron", "epithelial"]),
-    ("CMOTerm", ["measurement", "clinical", "assay"]),
-    ("DAOTerm", ["anatomy", "structure", "tissue"]),
-    ("DOTerm", ["disease", "syndrome", "disorder"]),
-    ("ECOTerm", ["evidence", "assertion", "experimental"]),
-    ("EMAPATerm", ["embryo", "development", "structure"]),
-    ("FBCVTerm", ["phenotype", "assay", "qualifier"]),
-    ("FBDVTerm", ["embryonic", "larval", "pupal"]),
-    ("GENOTerm", ["genotype", "allele", "homozygous"]),
-    ("GOTerm", ["process", "function", "component"]),
-    ("HPTerm", ["phenotype", "abnormality", "feature"]),
-    ("MATerm", ["anatomy", "structure", "organ"]),
-    ("MITerm", ["interaction", "binding", "association"]),
-    ("MMOTerm", ["measurement", "method", "assay"]),
-    ("MMUSDVTerm", ["development", "stage", "embryonic"]),
-    ("MODTerm", ["database", "organism", "model"]),
-    ("Molecule", ["protein", "rna", "molecule"]),
-    ("MPATHTerm", ["pathology", "lesion", "abnormality"]),
-    ("MPTerm", ["phenotype", "abnormal", "morphology"]),
-    ("NCBITaxonTerm", ["species", "genus", "organism"]),
-    ("OBITerm", ["assay", "device", "protocol"]),
-    ("PATOTerm", ["quality", "abnormal", "increased"]),
-    ("PWTerm", ["pathway", "signaling", "metabolic"]),
-    ("ROTerm", ["part", "relationship", "regulates"]),
-    ("RSTerm", ["strain", "rat", "genetic"]),
-    ("SOTerm", ["sequence", "region", "feature"]),
-    ("UBERONTerm", ["anatomy", "structure", "organ"]),
-    ("VTTerm", ["trait", "measurement", "phenotype"]),
-    ("WBBTTerm", ["anatomy", "cell", "structure"]),
-    ("WBLSTerm", ["larval", "adult", "embryonic"]),
-    ("WBPhenotypeTerm", ["phenotype", "variant", "defective"]),
-    ("XBATerm", ["anatomy", "tissue", "structure"]),
-    ("XBEDTerm", ["development", "embryonic", "stage"]),
-    ("XBSTerm", ["stage", "development", "embryonic"]),
-    ("XCOTerm", ["condition", "treatment", "experimental"]),
-    ("XPOTerm", ["phenotype", "abnormal", "morphology"]),
-    ("XSMOTerm", ["molecule", "compound", "chemical"]),
-    ("ZECOTerm", ["condition", "environment", "experimental"]),
-    ("ZFATerm", ["anatomy", "structure", "tissue"]),
-    ("ZFSTerm", ["stage", "development", "embryonic"]),
+    ("APOTerm", ["abnormal", "phenotype", "morphology"]),  # Ascomycete Phenotype (309 records)
+    ("ATPTerm", ["phenotype", "abnormal", "development"]),  # Alliance Phenotype (334 records)
+    ("BSPOTerm", ["anterior", "posterior", "proximal"]),  # Biological Spatial (139 records)
+    ("BTOTerm", ["tissue", "cell", "organ"]),  # BRENDA Tissue (6,511 records)
+    ("CHEBITerm", ["protein", "molecular", "chemical"]),  # Chemical Entities (204,377 records - LARGEST!)
+    ("CLTerm", ["cell", "neuron", "epithelial"]),  # Cell Ontology (3,129 records)
+    ("CMOTerm", ["measurement", "clinical", "assay"]),  # Clinical Measurement (4,039 records)
+    ("DAOTerm", ["anatomy", "structure", "tissue"]),  # Disease Anatomy (27,076 records)
+    ("DOTerm", ["disease", "syndrome", "disorder"]),  # Disease Ontology (11,946 records)
+    ("ECOTerm", ["evidence", "assertion", "experimental"]),  # Evidence & Conclusion (2,125 records)
+    ("EMAPATerm", ["embryo", "development", "structure"]),  # Mouse Developmental Anatomy (7,990 records)
+    ("FBCVTerm", ["phenotype", "assay", "qualifier"]),  # FlyBase Controlled Vocabulary (1,197 records)
+    ("FBDVTerm", ["embryonic", "larval", "pupal"]),  # FlyBase Development (210 records)
+    ("GENOTerm", ["genotype", "allele", "homozygous"]),  # Genotype Ontology (222 records)
+    ("GOTerm", ["process", "function", "component"]),  # Gene Ontology (39,906 records)
+    ("HPTerm", ["phenotype", "abnormality", "feature"]),  # Human Phenotype (19,232 records)
+    ("MATerm", ["anatomy", "structure", "organ"]),  # Mouse Adult Anatomy (3,230 records)
+    ("MITerm", ["interaction", "binding", "association"]),  # Molecular Interactions (1,467 records)
+    ("MMOTerm", ["measurement", "method", "assay"]),  # Measurement Method (850 records)
+    ("MMUSDVTerm", ["development", "stage", "embryonic"]),  # Mouse Development (134 records)
+    ("MODTerm", ["database", "organism", "model"]),  # Model Organism Database (1,978 records)
+    ("Molecule", ["protein", "rna", "molecule"]),  # Molecule entities (3,782 records)
+    ("MPATHTerm", ["pathology", "lesion", "abnormality"]),  # Mouse Pathology (841 records)
+    ("MPTerm", ["phenotype", "abnormal", "morphology"]),  # Mammalian Phenotype (14,451 records)
+    ("NCBITaxonTerm", ["species", "genus", "organism"]),  # NCBI Taxonomy (1,715 records)
+    ("OBITerm", ["assay", "device", "protocol"]),  # Biomedical Investigations (4,072 records)
+    ("PATOTerm", ["quality", "abnormal", "increased"]),  # Phenotypic Quality (1,887 records)
+    ("PWTerm", ["pathway", "signaling", "metabolic"]),  # Pathway Ontology (2,705 records)
+    ("ROTerm", ["part", "relationship", "regulates"]),  # Relation Ontology (664 records)
+    ("RSTerm", ["strain", "rat", "genetic"]),  # Rat Strain (5,443 records)
+    ("SOTerm", ["sequence", "region", "feature"]),  # Sequence Ontology (2,404 records)
+    ("UBERONTerm", ["anatomy", "structure", "organ"]),  # Cross-species Anatomy (14,668 records)
+    ("VTTerm", ["trait", "measurement", "phenotype"]),  # Vertebrate Trait (3,897 records)
+    ("WBBTTerm", ["anatomy", "cell", "structure"]),  # C. elegans Anatomy (6,762 records)
+    ("WBLSTerm", ["larval", "adult", "embryonic"]),  # C. elegans Life Stage (774 records)
+    ("WBPhenotypeTerm", ["phenotype", "variant", "defective"]),  # C. elegans Phenotype (2,650 records)
+    ("XBATerm", ["anatomy", "tissue", "structure"]),  # Xenopus Anatomy (1,684 records)
+    ("XBEDTerm", ["development", "embryonic", "stage"]),  # Xenopus Early Development (200 records)
+    ("XBSTerm", ["stage", "development", "embryonic"]),  # Xenopus Stages (96 records)
+    ("XCOTerm", ["condition", "treatment", "experimental"]),  # Experimental Conditions (1,684 records)
+    ("XPOTerm", ["phenotype", "abnormal", "morphology"]),  # Xenopus Phenotype (21,197 records)
+    ("XSMOTerm", ["molecule", "compound", "chemical"]),  # Xenopus Small Molecule (444 records)
+    ("ZECOTerm", ["condition", "environment", "experimental"]),  # Zebrafish Experimental Conditions (161 records)
+    ("ZFATerm", ["anatomy", "structure", "tissue"]),  # Zebrafish Anatomy (3,105 records)
+    ("ZFSTerm", ["stage", "development", "embryonic"]),  # Zebrafish Stages (54 records)
 ]
 
+ALL_ONTOLOGY_TYPES = [ontology_type for ontology_type, _ in ONTOLOGY_TEST_CASES]
 
-@pytest.fixture(scope="module")
-def db():
-    """Create DatabaseMethods instance for all tests."""
-    return DatabaseMethods()
+# Common search terms that likely exist across many ontologies
+ACCESSIBILITY_SEARCH_TERMS = ["a", "cell", "protein", "abnormal", "0"]
 
 
 class TestOntologySearchParameterized:
     """Parameterized tests for all ontology types."""
 
     @pytest.mark.parametrize("ontology_type,test_terms", ONTOLOGY_TEST_CASES)
-    def test_exact_match(self, db, ontology_type, test_terms):
+    def test_exact_match(self, ontology_type, test_terms):
         """Test exact match search for each ontology type."""
         # Use first test term for exact match
         term = test_terms[0]
-        results = db.search_ontology_terms(term=term, ontology_type=ontology_type, exact_match=True, limit=5)
+        results = cached_search(term=term, ontology_type=ontology_type, exact_match=True, limit=5)
 
         assert isinstance(results, list)
-        for result in results:
-            assert isinstance(result, OntologyTermResult)
-            assert result.ontology_type == ontology_type
-            # Exact match should contain the term in name or synonyms (case-insensitive)
-            term_found = term.lower() in result.name.lower() or any(
-                term.lower() in syn.lower() for syn in result.synonyms
-            )
-            assert term_found, f"Term '{term}' not found in name '{result.name}' or synonyms {result.synonyms}"
+        assert_ontology_results(results, ontology_type)
+        # Exact match should contain the term in name or synonyms (case-insensitive)
+        term_lower = term.lower()
+        assert all(
+            term_lower in r.name_lower or any(term_lower in syn.lower() for syn in r.synonyms) for r in results
+        ), f"Term '{term}' not found in name or synonyms of every result"
 
     @pytest.mark.parametrize("ontology_type,test_terms", ONTOLOGY_TEST_CASES)
-    def test_prefix_match(self, db, ontology_type, test_terms):
+    def test_prefix_match(self, ontology_type, test_terms):
         """Test prefix match search for each ontology type."""
         # Use second test term for prefix match
         term = test_terms[1] if len(test_terms) > 1 else test_terms[0]
-        results = db.search_ontology_terms(term=term, ontology_type=ontology_type, limit=10)
+        results = cached_search(term=term, ontology_type=ontology_type, limit=10)
 
         assert isinstance(results, list)
         # Should find at least some results for most ontologies
-        for result in results:
-            assert result.ontology_type == ontology_type
+        assert_ontology_results(results, ontology_type)
 
     @pytest.mark.parametrize("ontology_type,test_terms", ONTOLOGY_TEST_CASES)
-    def test_contains_match(self, db, ontology_type, test_terms):
+    def test_contains_match(self, ontology_type, test_terms):
         """Test contains match search for each ontology type."""
         # Use third test term for contains match
         term = test_terms[2] if len(test_terms) > 2 else test_terms[0]
-        results = db.search_ontology_terms(term=term, ontology_type=ontology_type, limit=10)
+        results = cached_search(term=term, ontology_type=ontology_type, limit=10)
 
         assert isinstance(results, list)
-        for result in results:
-            assert result.ontology_type == ontology_type
+        assert_ontology_results(results, ontology_type)
 
     @pytest.mark.parametrize("ontology_type,test_terms", ONTOLOGY_TEST_CASES)
-    def test_synonym_matching(self, db, ontology_type, test_terms):
+    def test_synonym_matching(self, ontology_type, test_terms):
         """Test synonym search for each ontology type."""
-        results = db.search_ontology_terms(
+        results = cached_search(
             term="cell",  # Common term likely to have synonyms
             ontology_type=ontology_type,
             include_synonyms=True,
@@ -129,56 +123,110 @@ class TestOntologySearchParameterized:
 
         assert isinstance(results, list)
         # May or may not have results, just verify structure
-        for result in results:
-            assert result.ontology_type == ontology_type
+        assert_ontology_results(results, ontology_type)
 
     @pytest.mark.parametrize("ontology_type,test_terms", ONTOLOGY_TEST_CASES)
-    def test_result_structure(self, db, ontology_type, test_terms):
+    def test_result_structure(self, ontology_type, test_terms):
         """Test that results have expected structure for each ontology type."""
-        results = db.search_ontology_terms(term=test_terms[0], ontology_type=ontology_type, limit=1)
+        results = cached_search(term=test_terms[0], ontology_type=ontology_type, limit=1)
 
-        if results:
-            result = results[0]
-            assert result.curie is not None
-            assert result.name is not None
-            assert result.namespace is not None
-            assert result.ontology_type == ontology_type
-            assert isinstance(result.synonyms, list)
+        assert_ontology_results(results, ontology_type)
 
     @pytest.mark.parametrize("ontology_type,_", ONTOLOGY_TEST_CASES)
-    def test_synonym_flag_behavior(self, db, ontology_type, _):
+    def test_synonym_flag_behavior(self, ontology_type, _):
         """Test that include_synonyms flag affects results for each ontology type."""
         # Search with synonyms
-        results_with_syn = db.search_ontology_terms(
-            term="cell", ontology_type=ontology_type, include_synonyms=True, limit=5
-        )
+        results_with_syn = cached_search(term="cell", ontology_type=ontology_type, include_synonyms=True, limit=5)
 
         # Search without synonyms
-        results_without_syn = db.search_ontology_terms(
-            term="cell", ontology_type=ontology_type, include_synonyms=False, limit=5
-        )
+        results_without_syn = cached_search(term="cell", ontology_type=ontology_type, include_synonyms=False, limit=5)
 
         assert isinstance(results_with_syn, list)
         assert isinstance(results_without_syn, list)
 
         # Results should be valid
-        for result in results_with_syn[:1]:
-            assert isinstance(result, OntologyTermResult)
-            assert result.ontology_type == ontology_type
+        assert_ontology_results(results_with_syn, ontology_type)
 
     @pytest.mark.parametrize("ontology_type,_", ONTOLOGY_TEST_CASES)
-    def test_exact_match_flag_behavior(self, db, ontology_type, _):
+    def test_exact_match_flag_behavior(self, ontology_type, _):
         """Test that exact_match flag affects results for each ontology type."""
         # Exact match only
-        exact_results = db.search_ontology_terms(term="cell", ontology_type=ontology_type, exact_match=True, limit=5)
+        exact_results = cached_search(term="cell", ontology_type=ontology_type, exact_match=True, limit=5)
 
         # Partial match (default)
-        partial_results = db.search_ontology_terms(term="cell", ontology_type=ontology_type, exact_match=False, limit=5)
+        partial_results = cached_search(term="cell", ontology_type=ontology_type, exact_match=False, limit=5)
 
         assert isinstance(exact_results, list)
         assert isinstance(partial_results, list)
 
 
-# Keep this for backwards compatibility with unittest-based test runners
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+def test_ontology_type_count():
+    """Test that the matrix covers all 45 ontology types."""
+    assert len(ALL_ONTOLOGY_TYPES) == 45
+
+
+@pytest.mark.parametrize("ont_type", ALL_ONTOLOGY_TYPES)
+def test_ontology_type_accessible(ont_type):
+    """Test that each ontology type can be searched."""
+    # Try multiple search terms to find at least one result
+    for search_term in ACCESSIBILITY_SEARCH_TERMS:
+        results = cached_search(term=search_term, ontology_type=ont_type, limit=1)
+
+        if len(results) > 0:
+            # Validate first result
+            assert isinstance(
+                results[0], OntologyTermResult
+            ), f"{ont_type}: Expected OntologyTermResult, got {type(results[0])}"
+            assert results[0].ontology_type == ont_type, f"{ont_type}: Expected ontology_type to match"
+            return
+
+    # All 45 should be accessible (based on our database query showing all have data)
+    pytest.fail(f"{ont_type}: no results for any of {ACCESSIBILITY_SEARCH_TERMS}")
+
+
+@pytest.mark.parametrize(
+    "ont_type,search_term",
+    [
+        ("WBBTTerm", "cell"),
+        ("GOTerm", "nucleus"),
+        ("CHEBITerm", "water"),
+        ("DOTerm", "disease"),
+        ("HPTerm", "abnormal"),
+    ],
+)
+def test_search_with_synonyms(ont_type, search_term):
+    """Test that synonym searching works for a sample of ontology types."""
+    # Search with synonyms
+    results_with_syn = cached_search(term=search_term, ontology_type=ont_type, include_synonyms=True, limit=5)
+
+    # Search without synonyms
+    results_without_syn = cached_search(term=search_term, ontology_type=ont_type, include_synonyms=False, limit=5)
+
+    assert isinstance(results_with_syn, list)
+    assert isinstance(results_without_syn, list)
+
+    # Results should be valid
+    assert_ontology_results(results_with_syn, ont_type)
+
+
+@pytest.mark.parametrize(
+    "ont_type,search_term",
+    [
+        ("GOTerm", "nucleus"),
+        ("WBBTTerm", "pharynx"),
+        ("CHEBITerm", "water"),
+    ],
+)
+def test_exact_vs_partial_match(ont_type, search_term):
+    """Test exact match vs partial match modes."""
+    # Exact match
+    exact_results = cached_search(term=search_term, ontology_type=ont_type, exact_match=True, limit=5)
+
+    # Partial match
+    partial_results = cached_search(term=search_term, ontology_type=ont_type, exact_match=False, limit=5)
+
+    assert isinstance(exact_results, list)
+    assert isinstance(partial_results, list)
+
+    # Partial should generally have >= exact (might find more)
+    # (Not always true, but usually)
@@ -1,16 +1,12 @@
 """Integration tests for validation-oriented database helper methods."""
 
-import os
-
 import pytest
 from sqlalchemy import text
 
 from agr_curation_api.db_methods import DatabaseMethods
 
-pytestmark = pytest.mark.skipif(
-    not os.getenv("PERSISTENT_STORE_DB_HOST"),
-    reason="Database integration tests require PERSISTENT_STORE_DB_* environment variables",
-)
+# Skipped at collection time (see conftest.py) unless database credentials are available
+pytestmark = pytest.mark.db_integration
 
 
 def current_database(db: DatabaseMethods) -> str:
@@ -29,8 +25,7 @@ def scalar_or_none(db: DatabaseMethods, query: str):
         session.close()
 
 
-def test_curation_validation_helpers_against_live_curation_db():
-    db = DatabaseMethods()
+def test_curation_validation_helpers_against_live_curation_db(db: DatabaseMethods):
     if current_database(db) != "curation":
         pytest.skip("Requires a curation database connection")
 
@@ -71,8 +66,7 @@ def test_curation_validation_helpers_against_live_curation_db():
         assert db.get_reference(obsolete_reference_curie) is None
 
 
-def test_literature_reference_helpers_against_live_literature_db():
-    db = DatabaseMethods()
+def test_literature_reference_helpers_against_live_literature_db(db: DatabaseMethods):
     if current_database(db) != "literature":
         pytest.skip("Requires a literature database connection")
 